@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from iris_wc.models import CategoryMap, Line, Order, ProductMap
+from iris_wc.models import CategoryMap, Line, Order, ProductMap, WebhookDelivery
 
 
 @admin.register(Order)
@@ -21,3 +21,9 @@ class ProductMapAdmin(admin.ModelAdmin):
 @admin.register(CategoryMap)
 class CategoryMapAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(WebhookDelivery)
+class WebhookDeliveryAdmin(admin.ModelAdmin):
+    list_display = ["id", "topic", "created", "processed_at", "attempts"]
+    list_filter = ["topic", "processed_at"]
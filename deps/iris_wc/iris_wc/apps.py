@@ -5,3 +5,6 @@ class IrisWcAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "iris_wc"
     verbose_name = "Iris WooCommerce"
+
+    def ready(self):
+        from iris_wc import signals  # noqa: F401
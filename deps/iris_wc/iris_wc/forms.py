@@ -0,0 +1,19 @@
+from django import forms
+
+
+class OrderPayloadForm(forms.Form):
+    id = forms.IntegerField(min_value=1)
+    status = forms.CharField(required=False)
+    customer_note = forms.CharField(required=False, strip=False)
+
+
+class LinePayloadForm(forms.Form):
+    id = forms.IntegerField(min_value=1)
+    product_id = forms.IntegerField(min_value=0)
+    category_id = forms.IntegerField(min_value=0)
+    quantity = forms.IntegerField(min_value=1, required=False)
+    name = forms.CharField(required=False)
+
+    def clean_quantity(self):
+        quantity = self.cleaned_data["quantity"]
+        return 1 if quantity is None else quantity
@@ -0,0 +1,223 @@
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils.timezone import now
+from django.utils.translation import gettext as _
+
+from iris.app.models import Item
+from iris_wc.forms import LinePayloadForm, OrderPayloadForm
+from iris_wc.mapping import ProcessResolver
+from iris_wc.models import Line, Order, WebhookDelivery
+
+WEBHOOK_TOPICS = ["order.created", "order.updated", "order.deleted"]
+WEBHOOK_BATCH_SIZE = 200
+WEBHOOK_MAX_ATTEMPTS = 5
+CANCELED_STATUSES = ["cancelled", "refunded", "failed", "trash"]
+
+
+class PayloadError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def clean_payload(topic, data):
+    if not isinstance(data, dict):
+        raise PayloadError({"order": _("The payload must be an object.")})
+    order = OrderPayloadForm(data)
+    if not order.is_valid():
+        raise PayloadError({"order": order.errors.get_json_data()})
+    payload = {**order.cleaned_data, "line_items": []}
+    if topic == "order.deleted":
+        return payload
+    lines = data.get("line_items", [])
+    if not isinstance(lines, list) or not all(isinstance(line, dict) for line in lines):
+        raise PayloadError({"line_items": _("The line items must be a list.")})
+    errors = []
+    for number, line in enumerate(lines, start=1):
+        form = LinePayloadForm(line)
+        if form.is_valid():
+            payload["line_items"].append(form.cleaned_data)
+        else:
+            errors.append({"line": number, "errors": form.errors.get_json_data()})
+    if errors:
+        raise PayloadError({"line_items": errors})
+    return payload
+
+
+def get_cancel_reason(topic, payload):
+    if topic == "order.deleted":
+        return _("Deleted in WooCommerce.")
+    if payload["status"] in CANCELED_STATUSES:
+        return _("Canceled in WooCommerce ({status}).").format(status=payload["status"])
+    return None
+
+
+def cancel_orders(orders, reasons):
+    for order in orders.values():
+        reason = reasons.get(order.wc_order_id)
+        if reason is not None and not order.canceled:
+            order.cancel(reason)
+
+
+def upsert_orders(payloads):
+    Order.objects.bulk_create(
+        [
+            Order(wc_order_id=wc_order_id, wc_order_notes=payload["customer_note"])
+            for wc_order_id, (topic, payload) in payloads.items()
+            if topic != "order.deleted"
+        ],
+        update_conflicts=True,
+        unique_fields=["wc_order_id"],
+        update_fields=["wc_order_notes", "modified"],
+    )
+    return Order.objects.in_bulk(list(payloads), field_name="wc_order_id")
+
+
+def upsert_lines(orders, payloads):
+    lines = {}
+    for wc_order_id, (_topic, payload) in payloads.items():
+        order = orders.get(wc_order_id)
+        if order is None or order.canceled:
+            continue
+        for line in payload["line_items"]:
+            lines[line["id"]] = Line(
+                order=order,
+                wc_order_item_id=line["id"],
+                wc_product_id=line["product_id"],
+                wc_category_id=line["category_id"],
+                quantity=line["quantity"],
+            )
+    Line.objects.bulk_create(
+        lines.values(),
+        update_conflicts=True,
+        unique_fields=["wc_order_item_id"],
+        update_fields=[
+            "order",
+            "wc_product_id",
+            "wc_category_id",
+            "quantity",
+            "modified",
+        ],
+    )
+    return lines
+
+
+def cancel_removed_lines(orders, lines):
+    for line in (
+        Line.objects.filter(
+            order__in=[order for order in orders.values() if not order.canceled],
+            cancel_time__isnull=True,
+        )
+        .exclude(wc_order_item_id__in=lines)
+        .select_related("item")
+    ):
+        line.cancel(_("Deleted in WooCommerce."))
+
+
+def create_items(payloads):
+    names = {
+        line["id"]: line["name"]
+        for _topic, payload in payloads.values()
+        for line in payload["line_items"]
+    }
+    lines = list(
+        Line.objects.filter(
+            wc_order_item_id__in=names,
+            item__isnull=True,
+            cancel_time__isnull=True,
+            order__cancel_time__isnull=True,
+        ).select_related("order")
+    )
+    resolver = ProcessResolver()
+    items = []
+    for line in lines:
+        line.process_id = resolver.resolve(line.wc_product_id, line.wc_category_id)
+        if line.process_id is not None:
+            line.item = Item(
+                process_id=line.process_id,
+                description=(
+                    names[line.wc_order_item_id]
+                    or _("WooCommerce order {order}").format(
+                        order=line.order.wc_order_id
+                    )
+                )[: Item._meta.get_field("description").max_length],
+                quantity=line.quantity,
+            )
+            items.append(line.item)
+    items = Item.objects.bulk_create(items)
+    Item.objects.filter(pk__in=[item.pk for item in items]).spawn_tasks()
+    Line.objects.bulk_update(lines, ["process", "item"])
+    return items
+
+
+def ingest_deliveries(deliveries):
+    payloads = {}
+    for delivery in deliveries:
+        payloads[delivery.payload["id"]] = (delivery.topic, delivery.payload)
+    orders = upsert_orders(payloads)
+    cancel_orders(
+        orders,
+        {
+            wc_order_id: get_cancel_reason(topic, payload)
+            for wc_order_id, (topic, payload) in payloads.items()
+        },
+    )
+    cancel_removed_lines(orders, upsert_lines(orders, payloads))
+    return create_items(payloads)
+
+
+def get_superseded(deliveries):
+    last_processed = dict(
+        WebhookDelivery.objects.filter(
+            wc_order_id__in={delivery.wc_order_id for delivery in deliveries},
+            processed_at__isnull=False,
+            error="",
+        )
+        .values("wc_order_id")
+        .annotate(last=Max("pk"))
+        .values_list("wc_order_id", "last")
+    )
+    return [
+        delivery
+        for delivery in deliveries
+        if delivery.pk < last_processed.get(delivery.wc_order_id, 0)
+    ]
+
+
+def process_deliveries(limit=WEBHOOK_BATCH_SIZE):
+    with transaction.atomic():
+        deliveries = list(
+            WebhookDelivery.objects.filter(processed_at__isnull=True)
+            .order_by("pk")
+            .select_for_update(skip_locked=True)[:limit]
+        )
+        if not deliveries:
+            return deliveries, []
+        superseded = get_superseded(deliveries)
+        pending = [delivery for delivery in deliveries if delivery not in superseded]
+        try:
+            with transaction.atomic():
+                items = ingest_deliveries(pending)
+            failed = []
+        except Exception:
+            items, failed = [], []
+            for delivery in pending:
+                try:
+                    with transaction.atomic():
+                        items += ingest_deliveries([delivery])
+                except Exception as e:
+                    delivery.error = repr(e)
+                    failed.append(delivery)
+        processed = now()
+        WebhookDelivery.objects.filter(
+            pk__in=[delivery.pk for delivery in pending if delivery not in failed]
+        ).update(processed_at=processed, attempts=F("attempts") + 1, error="")
+        WebhookDelivery.objects.filter(
+            pk__in=[delivery.pk for delivery in superseded]
+        ).update(processed_at=processed, error=_("Superseded by a newer delivery."))
+        for delivery in failed:
+            delivery.attempts += 1
+            if delivery.attempts >= WEBHOOK_MAX_ATTEMPTS:
+                delivery.processed_at = processed
+            delivery.save(update_fields=["attempts", "error", "processed_at"])
+    return deliveries, items
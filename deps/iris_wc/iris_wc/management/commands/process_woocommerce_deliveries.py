@@ -0,0 +1,40 @@
+from time import sleep
+
+from django.core.management.base import BaseCommand
+
+from iris_wc.ingestion import WEBHOOK_BATCH_SIZE, process_deliveries
+
+
+class Command(BaseCommand):
+    help = (
+        "Ingest the queued WooCommerce webhook deliveries into orders, items and tasks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=WEBHOOK_BATCH_SIZE)
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep waiting for new deliveries instead of exiting when the queue is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2,
+            help="Seconds to wait between polls of an empty queue.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            deliveries, items = process_deliveries(options["batch_size"])
+            if deliveries:
+                self.stdout.write(
+                    f"Processed {len(deliveries)} deliveries and created {len(items)} items."
+                )
+            elif not options["watch"]:
+                break
+            else:
+                try:
+                    sleep(options["interval"])
+                except KeyboardInterrupt:
+                    break
@@ -0,0 +1,34 @@
+from iris.app.caching import bump_version, get_version
+from iris_wc.models import CategoryMap, ProductMap
+
+PROCESS_MAPS_VERSION_NAME = "woocommerce_process_maps"
+
+_process_maps = None
+_process_maps_version = None
+
+
+def get_process_maps():
+    global _process_maps, _process_maps_version
+    version = get_version(PROCESS_MAPS_VERSION_NAME)
+    if version != _process_maps_version:
+        _process_maps = (
+            dict(ProductMap.objects.values_list("wc_product_id", "process")),
+            dict(CategoryMap.objects.values_list("wc_category_id", "process")),
+        )
+        _process_maps_version = version
+    return _process_maps
+
+
+class ProcessResolver:
+    def __init__(self):
+        self.products, self.categories = get_process_maps()
+
+    def resolve(self, wc_product_id, wc_category_id):
+        process = self.products.get(wc_product_id)
+        if process is None:
+            process = self.categories.get(wc_category_id)
+        return process
+
+
+def invalidate_process_maps():
+    bump_version(PROCESS_MAPS_VERSION_NAME)
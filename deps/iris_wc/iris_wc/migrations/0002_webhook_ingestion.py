@@ -0,0 +1,134 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def get_duplicates(model, field):
+    return sorted(
+        model.objects.order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .values_list(field, flat=True)
+    )
+
+
+def check_duplicate_orders_and_lines(apps, schema_editor):
+    errors = []
+    for model_name, field, label in [
+        ("Order", "wc_order_id", "orders"),
+        ("Line", "wc_order_item_id", "order items"),
+    ]:
+        duplicates = get_duplicates(apps.get_model("iris_wc", model_name), field)
+        if duplicates:
+            errors.append(
+                f"WooCommerce {label} stored more than once: "
+                + ", ".join(map(str, duplicates))
+            )
+    if errors:
+        raise RuntimeError(
+            "Merge or delete the duplicates before migrating. " + "; ".join(errors)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0008_task_events"),
+        ("iris_wc", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_duplicate_orders_and_lines, migrations.RunPython.noop
+        ),
+        migrations.CreateModel(
+            name="WebhookDelivery",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    models.DateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                ("topic", models.CharField(max_length=64, verbose_name="topic")),
+                ("payload", models.JSONField(verbose_name="payload")),
+                (
+                    "processed_at",
+                    models.DateTimeField(
+                        editable=False, null=True, verbose_name="processed at"
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0, editable=False, verbose_name="attempts"
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, editable=False, verbose_name="error"),
+                ),
+            ],
+            options={
+                "verbose_name": "webhook delivery",
+                "verbose_name_plural": "webhook deliveries",
+            },
+        ),
+        migrations.AddField(
+            model_name="line",
+            name="item",
+            field=models.OneToOneField(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="woocommerce_line",
+                to="iris.item",
+                verbose_name="item",
+            ),
+        ),
+        migrations.AddField(
+            model_name="line",
+            name="quantity",
+            field=models.IntegerField(default=1, verbose_name="quantity"),
+        ),
+        migrations.AddField(
+            model_name="line",
+            name="wc_product_id",
+            field=models.IntegerField(null=True, verbose_name="WooCommerce product ID"),
+        ),
+        migrations.AddConstraint(
+            model_name="line",
+            constraint=models.UniqueConstraint(
+                fields=("wc_order_item_id",),
+                name="iris_wc_line_wc_order_item_id_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="order",
+            constraint=models.UniqueConstraint(
+                fields=("wc_order_id",), name="iris_wc_order_wc_order_id_unique"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="webhookdelivery",
+            index=models.Index(
+                condition=models.Q(("processed_at__isnull", True)),
+                fields=["id"],
+                name="iris_wc_delivery_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:44
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_maps(apps, schema_editor):
+    errors = []
+    for model_name, field in [
+        ("ProductMap", "wc_product_id"),
+        ("CategoryMap", "wc_category_id"),
+    ]:
+        model = apps.get_model("iris_wc", model_name)
+        duplicates = (
+            model.objects.order_by()
+            .values(field)
+            .annotate(count=Count("pk"))
+            .filter(count__gt=1)
+            .values_list(field, flat=True)
+        )
+        for pk, wc_id, process in (
+            model.objects.filter(**{f"{field}__in": duplicates})
+            .order_by(field, "pk")
+            .values_list("pk", field, "process")
+        ):
+            errors.append(f"{model_name} #{pk} ({field} {wc_id}, process #{process})")
+    if errors:
+        raise RuntimeError(
+            "Keep one map per WooCommerce ID before migrating. Conflicting maps: "
+            + ", ".join(errors)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0008_task_events"),
+        ("iris_wc", "0002_webhook_ingestion"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_maps, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="categorymap",
+            constraint=models.UniqueConstraint(
+                fields=("wc_category_id",), name="iris_wc_categorymap_category_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productmap",
+            constraint=models.UniqueConstraint(
+                fields=("wc_product_id",), name="iris_wc_productmap_product_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.3 on 2026-10-18 07:05
+
+from django.db import migrations, models
+
+
+def set_delivery_orders(apps, schema_editor):
+    WebhookDelivery = apps.get_model("iris_wc", "WebhookDelivery")
+    deliveries = list(WebhookDelivery.objects.only("payload"))
+    for delivery in deliveries:
+        delivery.wc_order_id = delivery.payload["id"]
+    WebhookDelivery.objects.bulk_update(deliveries, ["wc_order_id"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris_wc", "0003_unique_process_maps"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhookdelivery",
+            name="wc_order_id",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="WooCommerce order ID"
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_delivery_orders, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="webhookdelivery",
+            index=models.Index(
+                condition=models.Q(("error", ""), ("processed_at__isnull", False)),
+                fields=["wc_order_id", "id"],
+                name="iris_wc_delivery_order_idx",
+            ),
+        ),
+    ]
@@ -8,14 +8,20 @@ class Order(TimestampMixin, CancelableMixin, NotesMixin, models.Model):
     wc_order_id = models.IntegerField(_("WooCommerce order ID"))
     wc_order_notes = models.TextField(_("WooCommerce order notes"), blank=True)
 
-    def cancel(reason):
-        super().cancel(reason)
+    def cancel(self, reason, datetime_=None):
+        super().cancel(reason, datetime_)
         for line in self.lines.all():
-            line.cancel(reason)
+            if not line.canceled:
+                line.cancel(reason, datetime_)
 
     class Meta:
         verbose_name = _("order")
         verbose_name_plural = _("orders")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wc_order_id"], name="iris_wc_order_wc_order_id_unique"
+            ),
+        ]
 
     def __str__(self):
         return _("WooCommerce order {obj.wc_order_id}").format(obj=self)
@@ -49,10 +55,31 @@ class Line(
         blank=True,
     )
     wc_order_item_id = models.IntegerField(_("WooCommerce order line ID"))
+    wc_product_id = models.IntegerField(_("WooCommerce product ID"), null=True)
+    quantity = models.IntegerField(_("quantity"), default=1)
+    item = models.OneToOneField(
+        "iris.Item",
+        verbose_name=_("item"),
+        on_delete=models.SET_NULL,
+        related_name="woocommerce_line",
+        null=True,
+        blank=True,
+    )
 
     class Meta:
         verbose_name = _("line")
         verbose_name_plural = _("lines")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wc_order_item_id"],
+                name="iris_wc_line_wc_order_item_id_unique",
+            ),
+        ]
+
+    def cancel(self, reason, datetime_=None):
+        super().cancel(reason, datetime_)
+        if self.item is not None and not self.item.canceled:
+            self.item.cancel(reason, datetime_)
 
     def __str__(self):
         return str(
@@ -77,6 +104,11 @@ class ProductMap(models.Model):
     class Meta:
         verbose_name = _("product map")
         verbose_name_plural = _("product maps")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wc_product_id"], name="iris_wc_productmap_product_unique"
+            ),
+        ]
 
     def __str__(self):
         return str(
@@ -97,6 +129,11 @@ class CategoryMap(WooCommerceCategoryMixin, models.Model):
     class Meta:
         verbose_name = _("category map")
         verbose_name_plural = _("category maps")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wc_category_id"], name="iris_wc_categorymap_category_unique"
+            ),
+        ]
 
     def __str__(self):
         return str(
@@ -104,3 +141,31 @@ class CategoryMap(WooCommerceCategoryMixin, models.Model):
                 f"Map: WooCommerce category {self.wc_category_id} -> Process {self.process}"
             )
         )
+
+
+class WebhookDelivery(TimestampMixin, models.Model):
+    topic = models.CharField(_("topic"), max_length=64)
+    wc_order_id = models.IntegerField(_("WooCommerce order ID"), editable=False)
+    payload = models.JSONField(_("payload"))
+    processed_at = models.DateTimeField(_("processed at"), null=True, editable=False)
+    attempts = models.PositiveIntegerField(_("attempts"), default=0, editable=False)
+    error = models.TextField(_("error"), blank=True, editable=False)
+
+    class Meta:
+        verbose_name = _("webhook delivery")
+        verbose_name_plural = _("webhook deliveries")
+        indexes = [
+            models.Index(
+                fields=["id"],
+                name="iris_wc_delivery_pending_idx",
+                condition=models.Q(processed_at__isnull=True),
+            ),
+            models.Index(
+                fields=["wc_order_id", "id"],
+                name="iris_wc_delivery_order_idx",
+                condition=models.Q(processed_at__isnull=False, error=""),
+            ),
+        ]
+
+    def __str__(self):
+        return _("WooCommerce {obj.topic} delivery {obj.pk}").format(obj=self)
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from iris_wc.mapping import invalidate_process_maps
+from iris_wc.models import CategoryMap, ProductMap
+
+
+@receiver(post_save, sender=ProductMap)
+@receiver(post_delete, sender=ProductMap)
+@receiver(post_save, sender=CategoryMap)
+@receiver(post_delete, sender=CategoryMap)
+def invalidate_mapped_processes(sender, **kwargs):
+    transaction.on_commit(invalidate_process_maps)
@@ -0,0 +1,198 @@
+import hmac
+import json
+from base64 import b64encode
+from hashlib import sha256
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+
+from iris.app.models import Item, Process, Step, StepTransition
+from iris_wc.ingestion import clean_payload, process_deliveries
+from iris_wc.models import Line, Order, ProductMap, WebhookDelivery
+
+SECRET = "secret"
+
+
+def sign(body, secret=SECRET):
+    return b64encode(hmac.new(secret.encode(), body, sha256).digest()).decode()
+
+
+def order_payload(wc_order_id, status="processing", lines=()):
+    return {
+        "id": wc_order_id,
+        "status": status,
+        "customer_note": "",
+        "line_items": [
+            {
+                "id": line,
+                "product_id": 10,
+                "category_id": 20,
+                "quantity": 1,
+                "name": f"Line {line}",
+            }
+            for line in lines
+        ],
+    }
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    IRIS_WC_WEBHOOK_SECRET=SECRET,
+)
+class WebhookViewTests(TestCase):
+    def post(self, data, topic="order.created", signature=None):
+        body = data if isinstance(data, bytes) else json.dumps(data).encode()
+        return self.client.post(
+            reverse("iris_wc:webhook"),
+            body,
+            content_type="application/json",
+            headers={
+                "X-WC-Webhook-Topic": topic,
+                "X-WC-Webhook-Signature": (
+                    sign(body) if signature is None else signature
+                ),
+            },
+        )
+
+    def test_queues_delivery(self):
+        response = self.post(order_payload(7, lines=[1]))
+        self.assertEqual(response.status_code, 202)
+        delivery = WebhookDelivery.objects.get()
+        self.assertEqual(response.json(), {"delivery": delivery.pk})
+        self.assertEqual(delivery.wc_order_id, 7)
+        self.assertIsNone(delivery.processed_at)
+
+    def test_bad_signature(self):
+        body = json.dumps(order_payload(7)).encode()
+        for signature in ["", "invalid", sign(body, "other")]:
+            with self.subTest(signature=signature):
+                response = self.post(body, signature=signature)
+                self.assertEqual(response.status_code, 401)
+        self.assertFalse(WebhookDelivery.objects.exists())
+
+    @override_settings(IRIS_WC_WEBHOOK_SECRET=None)
+    def test_not_configured(self):
+        self.assertEqual(self.post(order_payload(7)).status_code, 404)
+
+    def test_ping(self):
+        body = b"webhook_id=3"
+        response = self.client.post(
+            reverse("iris_wc:webhook"),
+            body,
+            content_type="application/x-www-form-urlencoded",
+            headers={"X-WC-Webhook-Signature": sign(body)},
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(WebhookDelivery.objects.exists())
+
+    def test_invalid_requests(self):
+        line = order_payload(7, lines=[1])
+        del line["line_items"][0]["product_id"]
+        for data, topic in [
+            (order_payload(7), "product.created"),
+            (b"{", "order.created"),
+            ([], "order.created"),
+            ({"id": "seven"}, "order.created"),
+            (line, "order.updated"),
+            ({**order_payload(7), "line_items": {}}, "order.updated"),
+        ]:
+            with self.subTest(data=data, topic=topic):
+                self.assertEqual(self.post(data, topic).status_code, 400)
+        self.assertFalse(WebhookDelivery.objects.exists())
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class IngestionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.process = Process.objects.create(name="Process")
+        StepTransition.objects.create(
+            process=cls.process, creates=Step.objects.create(name="Step")
+        )
+        ProductMap.objects.create(wc_product_id=10, process=cls.process)
+
+    def setUp(self):
+        cache.clear()
+
+    def deliver(self, payload, topic="order.updated"):
+        return WebhookDelivery.objects.create(
+            topic=topic,
+            wc_order_id=payload["id"],
+            payload=clean_payload(topic, payload),
+        )
+
+    def test_creates_items(self):
+        self.deliver(order_payload(7, lines=[1, 2]), "order.created")
+        deliveries, items = process_deliveries()
+        self.assertEqual(len(deliveries), 1)
+        self.assertEqual(len(items), 2)
+        order = Order.objects.get(wc_order_id=7)
+        self.assertEqual(
+            sorted(order.lines.values_list("wc_order_item_id", "process", "item")),
+            sorted(
+                (line, self.process.pk, item.pk) for line, item in zip([1, 2], items)
+            ),
+        )
+        self.assertEqual(Item.objects.filter(task_count=1).count(), 2)
+        self.assertFalse(
+            WebhookDelivery.objects.filter(processed_at__isnull=True).exists()
+        )
+
+    def test_replays_are_idempotent(self):
+        payload = order_payload(7, lines=[1])
+        self.deliver(payload, "order.created")
+        self.deliver(payload)
+        process_deliveries()
+        self.deliver(payload)
+        process_deliveries()
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(Line.objects.count(), 1)
+        self.assertEqual(Item.objects.count(), 1)
+        self.assertEqual(
+            list(WebhookDelivery.objects.values_list("error", "attempts")),
+            [("", 1)] * 3,
+        )
+
+    def test_superseded_delivery(self):
+        old = self.deliver(order_payload(7, lines=[1]))
+        new = self.deliver(order_payload(7, lines=[2]))
+        WebhookDelivery.objects.filter(pk=new.pk).update(processed_at=now())
+        deliveries, items = process_deliveries()
+        self.assertEqual(deliveries, [old])
+        self.assertEqual(items, [])
+        old.refresh_from_db()
+        self.assertEqual(old.error, "Superseded by a newer delivery.")
+        self.assertFalse(Line.objects.exists())
+
+    def test_canceled_order_cancels_lines_and_items(self):
+        self.deliver(order_payload(7, lines=[1, 2]), "order.created")
+        process_deliveries()
+        self.deliver(order_payload(7, status="cancelled", lines=[1, 2]))
+        process_deliveries()
+        order = Order.objects.get()
+        self.assertTrue(order.canceled)
+        self.assertEqual(order.cancel_reason, "Canceled in WooCommerce (cancelled).")
+        self.assertFalse(Line.objects.filter(cancel_time__isnull=True).exists())
+        self.assertFalse(Item.objects.filter(cancel_time__isnull=True).exists())
+
+    def test_deleted_order(self):
+        self.deliver(order_payload(7, lines=[1]), "order.created")
+        process_deliveries()
+        self.deliver({"id": 7}, "order.deleted")
+        process_deliveries()
+        self.assertEqual(Item.objects.get().cancel_reason, "Deleted in WooCommerce.")
+
+    def test_removed_line_is_canceled(self):
+        self.deliver(order_payload(7, lines=[1, 2]), "order.created")
+        process_deliveries()
+        self.deliver(order_payload(7, lines=[2]))
+        process_deliveries()
+        self.assertEqual(
+            dict(Line.objects.values_list("wc_order_item_id", "item__cancel_reason")),
+            {1: "Deleted in WooCommerce.", 2: ""},
+        )
+        self.assertFalse(Order.objects.get().canceled)
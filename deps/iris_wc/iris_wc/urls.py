@@ -0,0 +1,9 @@
+from django.urls import path
+
+from iris_wc.views import WebhookView
+
+app_name = "iris_wc"
+
+urlpatterns = [
+    path("webhook/", WebhookView.as_view(), name="webhook"),
+]
@@ -0,0 +1,53 @@
+import hmac
+import json
+from base64 import b64encode
+from hashlib import sha256
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
+from django.utils.translation import gettext as _
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from iris_wc.ingestion import WEBHOOK_TOPICS, PayloadError, clean_payload
+from iris_wc.models import WebhookDelivery
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class WebhookView(View):
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        if not settings.IRIS_WC_WEBHOOK_SECRET:
+            raise Http404(_("The WooCommerce webhook is not configured."))
+
+    def verify_signature(self, request):
+        expected = b64encode(
+            hmac.new(
+                settings.IRIS_WC_WEBHOOK_SECRET.encode(), request.body, sha256
+            ).digest()
+        ).decode()
+        return hmac.compare_digest(
+            request.headers.get("X-WC-Webhook-Signature", ""), expected
+        )
+
+    def post(self, request, *args, **kwargs):
+        if not self.verify_signature(request):
+            return JsonResponse({"error": _("Invalid signature.")}, status=401)
+        if "webhook_id" in request.POST:
+            return HttpResponse(status=204)
+        topic = request.headers.get("X-WC-Webhook-Topic", "")
+        if topic not in WEBHOOK_TOPICS:
+            return JsonResponse({"error": _("Unsupported topic.")}, status=400)
+        try:
+            payload = clean_payload(topic, json.loads(request.body))
+        except ValueError as e:
+            return JsonResponse(
+                {"error": _("Invalid JSON: {error}").format(error=e)}, status=400
+            )
+        except PayloadError as e:
+            return JsonResponse({"errors": e.errors}, status=400)
+        delivery = WebhookDelivery.objects.create(
+            topic=topic, wc_order_id=payload["id"], payload=payload
+        )
+        return JsonResponse({"delivery": delivery.pk}, status=202)
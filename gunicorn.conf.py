@@ -0,0 +1,39 @@
+from json import loads
+from multiprocessing import cpu_count
+from os import getenv
+
+DJANGO_SERVER_INTERFACE = getenv("DJANGO_SERVER_INTERFACE", "asgi")
+
+bind = getenv("DJANGO_SERVER_BIND", "0.0.0.0:8000")
+workers = int(getenv("DJANGO_SERVER_WORKERS", cpu_count() * 2 + 1))
+reload = loads(getenv("DJANGO_SERVER_RELOAD", "false"))
+preload_app = not reload and loads(getenv("DJANGO_SERVER_PRELOAD", "true"))
+max_requests = int(getenv("DJANGO_SERVER_MAX_REQUESTS", 10000))
+max_requests_jitter = max_requests // 10
+graceful_timeout = int(getenv("DJANGO_SERVER_GRACEFUL_TIMEOUT", 30))
+timeout = int(getenv("DJANGO_SERVER_TIMEOUT", 60))
+accesslog = "-"
+
+if DJANGO_SERVER_INTERFACE == "wsgi":
+    wsgi_app = "iris.wsgi:application"
+    worker_class = "gthread"
+    threads = int(getenv("DJANGO_SERVER_THREADS", 4))
+else:
+    wsgi_app = "iris.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+
+
+def post_worker_init(worker):
+    from django.conf import settings
+
+    if settings.IRIS_DELAY_SCHEDULER:
+        from iris.app.scheduling import delay_scheduler
+
+        delay_scheduler.start()
+        worker.delay_scheduler = delay_scheduler
+
+
+def worker_exit(server, worker):
+    scheduler = getattr(worker, "delay_scheduler", None)
+    if scheduler is not None:
+        scheduler.stop()
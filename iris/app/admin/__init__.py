@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.db.models import Count, F, Q
+from django.db.models import F, Prefetch
 from django.forms import ModelChoiceField, ModelMultipleChoiceField
 from django.urls import path, resolve
 from django.utils.text import Truncator
@@ -24,6 +24,7 @@ from iris.app.admin.views import (
     ItemSpawnTasksView,
     SuspendTasksView,
 )
+from iris.app.caching import get_transition_labels
 from iris.app.models import (
     Commit,
     Delay,
@@ -66,14 +67,10 @@ class ItemCompletionListFilter(admin.SimpleListFilter):
         if self.value() is None:
             return queryset
 
-        queryset = queryset.annotate(
-            total_tasks=Count("tasks"),
-            completed_tasks=Count("tasks", filter=Q(tasks__commit__isnull=False)),
-        )
         if self.value() == "completed":
-            return queryset.filter(total_tasks=F("completed_tasks"))
+            return queryset.filter(task_count=F("committed_count"))
         else:
-            return queryset.exclude(total_tasks=F("completed_tasks"))
+            return queryset.exclude(task_count=F("committed_count"))
 
 
 class ProcessModelChoiceField(ModelChoiceField):
@@ -186,6 +183,9 @@ class TaskAdmin(CompletableAdminMixin, admin.ModelAdmin):
     list_filter = (TaskCompletionListFilter,)
     actions = [tasks_commit_tasks, tasks_delay_tasks, tasks_suspend_tasks]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_state()
+
     @admin.display(description=_("Delayed"), boolean=True)
     def delayed(self, obj):
         return obj.delayed
@@ -237,8 +237,9 @@ class TaskAdmin(CompletableAdminMixin, admin.ModelAdmin):
         ]
 
 
-def format_transition(obj):
-    if obj.required_steps.count() == 0:
+def render_transition(obj):
+    required_steps = obj.required_steps.all()
+    if len(required_steps) == 0:
         return _(
             "Spawns a task for step '{obj.creates.name}' when the process '{obj.process.name}' starts"
         ).format(
@@ -249,10 +250,7 @@ def format_transition(obj):
         required_names = (
             "("
             + ", ".join(
-                [
-                    f"'{transition.creates.name}'"
-                    for transition in obj.required_steps.all()
-                ]
+                [f"'{transition.creates.name}'" for transition in required_steps]
             )
             + ")"
         )
@@ -264,6 +262,27 @@ def format_transition(obj):
         )
 
 
+def render_process_transitions(process):
+    transitions = (
+        StepTransition.objects.filter(process=process)
+        .select_related("process", "creates")
+        .prefetch_related(
+            Prefetch(
+                "required_steps",
+                queryset=StepTransition.objects.select_related("creates"),
+            )
+        )
+    )
+    return {transition.pk: render_transition(transition) for transition in transitions}
+
+
+def format_transition(obj):
+    if obj.pk is None:
+        return render_transition(obj)
+    labels = get_transition_labels(obj.process_id, render_process_transitions)
+    return labels.get(obj.pk) or render_transition(obj)
+
+
 class StepTransitionModelChoiceField(ModelChoiceField):
     def label_from_instance(self, obj):
         return format_transition(obj)
@@ -296,6 +315,9 @@ class StepTransitionAdmin(admin.ModelAdmin):
     list_display = ["id", "transition_description", "process_name"]
     list_display_links = ["id", "transition_description"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("process")
+
     @admin.display(description=_("Description"))
     def transition_description(self, obj):
         return format_transition(obj)
@@ -325,6 +347,18 @@ class WorkerAdmin(admin.ModelAdmin):
         return _("Profile assigned to user '{obj.user.username}'").format(obj=obj)
 
 
+class TaskRecordAdminMixin:
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related(
+                "task__item", "task__step_transition__creates", "worker__user"
+            )
+            .prefetch_related("task__step_transition__creates__stations")
+        )
+
+
 def format_item_for_status(obj):
     return (
         f"#{obj.pk} ---"
@@ -334,7 +368,7 @@ def format_item_for_status(obj):
 
 
 @admin.register(Commit)
-class CommitAdmin(admin.ModelAdmin):
+class CommitAdmin(TaskRecordAdminMixin, admin.ModelAdmin):
     list_display = [
         "id",
         "step_description",
@@ -411,7 +445,7 @@ class NoteTemplateAdmin(admin.ModelAdmin):
 
 
 @admin.register(Delay)
-class DelayAdmin(admin.ModelAdmin):
+class DelayAdmin(TaskRecordAdminMixin, admin.ModelAdmin):
     list_display = [
         "id",
         "duration",
@@ -461,7 +495,7 @@ class DelayAdmin(admin.ModelAdmin):
 
 
 @admin.register(Suspension)
-class SuspensionAdmin(admin.ModelAdmin):
+class SuspensionAdmin(TaskRecordAdminMixin, admin.ModelAdmin):
     list_display = [
         "id",
         "lifted",
@@ -116,9 +116,8 @@ class ItemSpawnTasksView(ConfirmationViewMixin):
 
     def get(self, request, *args, **kwargs):
         _ids, items = self.get_ids_and_items(request)
-        for item in items:
-            if item.tasks.count() > 0:
-                return super().get(request, *args, **kwargs)
+        if items.filter(tasks__isnull=False).exists():
+            return super().get(request, *args, **kwargs)
         return self.apply(request)
 
     def get_context_data(self, **kwargs):
@@ -137,8 +136,7 @@ class ItemSpawnTasksView(ConfirmationViewMixin):
     def apply(self, request):
         _ids, items = self.get_ids_and_items(request)
         with transaction.atomic():
-            for item in items:
-                item.spawn_tasks()
+            items.spawn_tasks()
         messages.info(request, _("Tasks spawned."))
         return HttpResponseRedirect(reverse("admin:iris_item_changelist"))
 
@@ -184,8 +182,7 @@ class CommitSpawnAndConsolidateTasksView(ConfirmationViewMixin):
     def apply(self, request):
         _ids, commits = self.get_ids_and_commits(request)
         with transaction.atomic():
-            for commit in commits:
-                commit.spawn_and_consolidate_tasks()
+            commits.spawn_and_consolidate_tasks()
         messages.info(request, _("Tasks spawned."))
         return HttpResponseRedirect(reverse("admin:iris_commit_changelist"))
 
@@ -237,13 +234,15 @@ class AddActionsTaskViewMixin(AdminContextMixin, FormView):
 
     def get_ids_and_tasks(self, request):
         ids = request.GET["ids"]
-        return ids, Task.objects.filter(pk__in=ids.split(","))
+        return ids, Task.objects.filter(pk__in=ids.split(",")).select_related("commit")
+
+    def check_and_log_all(self, tasks):
+        return any(self.check_and_log(task) for task in tasks)
 
     def get(self, request, *args, **kwargs):
         _ids, tasks = self.get_ids_and_tasks(request)
-        for task in tasks:
-            if self.check_and_log(task):
-                return HttpResponseRedirect(reverse("admin:iris_task_changelist"))
+        if self.check_and_log_all(tasks):
+            return HttpResponseRedirect(reverse("admin:iris_task_changelist"))
         return super().get(request, *args, **kwargs)
 
 
@@ -263,11 +262,15 @@ class CommitTasksView(PermissionRequiredMixin, AddActionsTaskViewMixin):
         ids, tasks = self.get_ids_and_tasks(self.request)
         worker = form.cleaned_data["worker"]
         with transaction.atomic():
-            for task in tasks:
-                if self.check_and_log(task):
-                    return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
-            for task in tasks:
-                Commit(task=task, worker=worker).save()
+            tasks = list(tasks)
+            if self.check_and_log_all(tasks):
+                return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
+            commits = Commit.objects.bulk_create(
+                [Commit(task=task, worker=worker) for task in tasks]
+            )
+            Commit.objects.filter(
+                pk__in=[commit.pk for commit in commits]
+            ).spawn_and_consolidate_tasks()
         messages.info(self.request, _("The tasks were commited."))
         return super().form_valid(form)
 
@@ -289,11 +292,12 @@ class DelayTasksView(PermissionRequiredMixin, AddActionsTaskViewMixin):
         worker = form.cleaned_data["worker"]
         duration = form.cleaned_data["duration"]
         with transaction.atomic():
-            for task in tasks:
-                if self.check_and_log(task):
-                    return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
-            for task in tasks:
-                Delay(task=task, worker=worker, duration=duration).save()
+            tasks = list(tasks)
+            if self.check_and_log_all(tasks):
+                return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
+            Delay.objects.bulk_create(
+                [Delay(task=task, worker=worker, duration=duration) for task in tasks]
+            )
         messages.info(self.request, _("The tasks were delayed."))
         return super().form_valid(form)
 
@@ -314,10 +318,11 @@ class SuspendTasksView(PermissionRequiredMixin, AddActionsTaskViewMixin):
         ids, tasks = self.get_ids_and_tasks(self.request)
         worker = form.cleaned_data["worker"]
         with transaction.atomic():
-            for task in tasks:
-                if self.check_and_log(task):
-                    return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
-            for task in tasks:
-                Suspension(task=task, worker=worker).save()
+            tasks = list(tasks)
+            if self.check_and_log_all(tasks):
+                return HttpResponseRedirect(self.request.path_info + f"?ids={ids}")
+            Suspension.objects.bulk_create(
+                [Suspension(task=task, worker=worker) for task in tasks]
+            )
         messages.info(self.request, _("The tasks were suspended."))
         return super().form_valid(form)
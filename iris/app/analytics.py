@@ -0,0 +1,211 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, DurationField, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils.timezone import localdate, make_aware, now
+
+from iris.app.models import (
+    Commit,
+    DailySummary,
+    Delay,
+    Step,
+    SummaryRun,
+    Suspension,
+    Task,
+)
+
+SUMMARY_BATCH_SIZE = 1000
+SUMMARY_LOCK = "iris:summaries"
+
+DURATION_FIELDS = ["lead_time", "delay_time", "suspension_time"]
+
+
+def _summary_sources():
+    return [
+        (
+            Task.objects.all(),
+            "created",
+            "step_transition__creates",
+            {"tasks_created": Count("pk")},
+        ),
+        (
+            Commit.objects.all(),
+            "created",
+            "task__step_transition__creates",
+            {
+                "tasks_committed": Count("pk"),
+                "lead_time": Sum(
+                    F("created") - F("task__created"), output_field=DurationField()
+                ),
+            },
+        ),
+        (
+            Delay.objects.all(),
+            "created",
+            "task__step_transition__creates",
+            {"delays": Count("pk"), "delay_time": Sum("duration")},
+        ),
+        (
+            Suspension.objects.filter(lifted_at__isnull=False),
+            "lifted_at",
+            "task__step_transition__creates",
+            {
+                "suspensions_lifted": Count("pk"),
+                "suspension_time": Sum(
+                    F("lifted_at") - F("created"), output_field=DurationField()
+                ),
+            },
+        ),
+    ]
+
+
+def get_changed_days(since):
+    days = set(
+        DailySummary.objects.filter(stale=True)
+        .order_by()
+        .values_list("day", flat=True)
+        .distinct()
+    )
+    for queryset, date_field, _step, _aggregates in _summary_sources():
+        days.update(
+            queryset.filter(modified__gte=since)
+            .annotate(day=TruncDate(date_field))
+            .order_by()
+            .values_list("day", flat=True)
+            .distinct()
+        )
+    return days
+
+
+def invalidate_summaries(*args, **kwargs):
+    DailySummary.objects.filter(*args, **kwargs).update(stale=True)
+
+
+def invalidate_record_summaries(record):
+    for queryset, date_field, _step, _aggregates in _summary_sources():
+        if isinstance(record, queryset.model):
+            moment = getattr(record, date_field)
+            if moment is not None:
+                invalidate_summaries(day=localdate(moment))
+
+
+def get_all_days():
+    days = set()
+    for queryset, date_field, _step, _aggregates in _summary_sources():
+        days.update(
+            queryset.annotate(day=TruncDate(date_field))
+            .order_by()
+            .values_list("day", flat=True)
+            .distinct()
+        )
+    return days
+
+
+def _start_of_day(day):
+    return make_aware(datetime.combine(day, time()))
+
+
+def _day_ranges(date_field, days):
+    ranges = []
+    for day in sorted(days):
+        if ranges and ranges[-1][1] == day:
+            ranges[-1][1] = day + timedelta(days=1)
+        else:
+            ranges.append([day, day + timedelta(days=1)])
+    condition = Q(pk__in=[])
+    for start, end in ranges:
+        condition |= Q(
+            **{
+                f"{date_field}__gte": _start_of_day(start),
+                f"{date_field}__lt": _start_of_day(end),
+            }
+        )
+    return condition
+
+
+def summarize_days(days):
+    totals = defaultdict(dict)
+    for queryset, date_field, step, aggregates in _summary_sources():
+        for row in (
+            queryset.filter(_day_ranges(date_field, days))
+            .annotate(day=TruncDate(date_field), step_id=F(step))
+            .order_by()
+            .values("day", "step_id")
+            .annotate(**aggregates)
+        ):
+            totals[(row.pop("day"), row.pop("step_id"))].update(row)
+    step_stations = defaultdict(list)
+    for step, station in Step.stations.through.objects.values_list("step", "station"):
+        step_stations[step].append(station)
+    summaries = [
+        DailySummary(
+            station_id=station,
+            step_id=step,
+            day=day,
+            **{
+                field: value
+                for field, value in values.items()
+                if value is not None or field not in DURATION_FIELDS
+            },
+        )
+        for (day, step), values in totals.items()
+        for station in step_stations[step]
+    ]
+    DailySummary.objects.filter(day__in=days).delete()
+    DailySummary.objects.bulk_create(summaries, batch_size=SUMMARY_BATCH_SIZE)
+    return summaries
+
+
+def get_last_run():
+    return SummaryRun.objects.order_by("-started").first()
+
+
+def lock_summaries():
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [SUMMARY_LOCK])
+
+
+def update_summaries(full=False, batch_days=31):
+    started = now()
+    with transaction.atomic():
+        lock_summaries()
+        last_run = get_last_run()
+        if full or last_run is None:
+            DailySummary.objects.all().delete()
+            days = get_all_days()
+        else:
+            days = get_changed_days(last_run.started - timedelta(minutes=5))
+        days = sorted(days)
+        for index in range(0, len(days), batch_days):
+            summarize_days(days[index : index + batch_days])
+        return SummaryRun.objects.create(started=started, days=len(days))
+
+
+SUMMARY_TOTALS = [
+    "tasks_created",
+    "tasks_committed",
+    "lead_time",
+    "delays",
+    "delay_time",
+    "suspensions_lifted",
+    "suspension_time",
+]
+
+
+def get_summary_rows(summaries, label, *fields):
+    rows = list(
+        summaries.order_by(label, *fields)
+        .values(label, *fields)
+        .annotate(**{total: Sum(total) for total in SUMMARY_TOTALS})
+    )
+    for row in rows:
+        row["label"] = row[label]
+        row["average_lead_time"] = (
+            row["lead_time"] / row["tasks_committed"]
+            if row["tasks_committed"]
+            else None
+        )
+    return rows
@@ -1,7 +1,14 @@
 from django.apps import AppConfig
+from django.core.checks import Tags, register
 
 
 class IrisAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "iris.app"
     label = "iris"
+
+    def ready(self):
+        from iris.app import signals  # noqa: F401
+        from iris.app.caching import check_shared_cache
+
+        register(check_shared_cache, Tags.caches)
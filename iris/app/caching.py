@@ -0,0 +1,124 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils.translation import get_language
+
+
+def _version_key(name):
+    return f"iris:version:{name}"
+
+
+def get_version(name):
+    key = _version_key(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(name):
+    cache.set(_version_key(name), uuid4().hex, None)
+
+
+PROCESS_LOCAL_CACHE_BACKENDS = [
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+]
+
+
+def check_shared_cache(app_configs, **kwargs):
+    if settings.CACHES["default"]["BACKEND"] in PROCESS_LOCAL_CACHE_BACKENDS:
+        return [
+            checks.Warning(
+                "The default cache is not shared between processes.",
+                hint="Cached versions will not be invalidated across workers.",
+                id="iris.W001",
+            )
+        ]
+    return []
+
+
+STATION_TASKS_CACHED_STATUSES = ["pending", "delayed", "suspended"]
+STATION_TASKS_TIMEOUT = 900
+
+station_tasks_stats = {"hits": 0, "misses": 0}
+
+
+def _station_tasks_version_name(station):
+    return f"station_tasks:{station}"
+
+
+def get_station_task_keys(station, status):
+    from iris.app.managers import DISPATCH_ORDERING
+    from iris.app.models import Task
+
+    version = get_version(_station_tasks_version_name(station))
+    key = f"iris:station_tasks:{station}:{status}:{version}"
+    task_keys = cache.get(key)
+    if task_keys is not None:
+        station_tasks_stats["hits"] += 1
+        return task_keys
+    station_tasks_stats["misses"] += 1
+    tasks = getattr(Task.objects.in_station(station), status)().in_dispatch_order()
+    task_keys = list(
+        tasks.values_list(*[field.removeprefix("-") for field in DISPATCH_ORDERING])
+    )
+    cache.set(key, task_keys, STATION_TASKS_TIMEOUT)
+    return task_keys
+
+
+def invalidate_station_tasks(stations):
+    for station in stations:
+        bump_version(_station_tasks_version_name(station))
+
+
+STATIONS_VERSION_NAME = "stations"
+
+_stations = None
+_stations_version = None
+
+
+def get_station_list():
+    global _stations, _stations_version
+    from iris.app.models import Station
+
+    version = get_version(STATIONS_VERSION_NAME)
+    if version != _stations_version:
+        _stations = list(
+            Station.objects.annotate(step_count=Count("steps"))
+            .order_by("pk")
+            .values("pk", "name", "step_count")
+        )
+        _stations_version = version
+    return _stations
+
+
+def invalidate_station_list():
+    bump_version(STATIONS_VERSION_NAME)
+
+
+TRANSITION_LABELS_VERSION_NAME = "transition_labels"
+
+_transition_labels = {}
+_transition_labels_version = None
+
+
+def get_transition_labels(process, render):
+    global _transition_labels_version
+    version = get_version(TRANSITION_LABELS_VERSION_NAME)
+    if version != _transition_labels_version:
+        _transition_labels.clear()
+        _transition_labels_version = version
+    key = (get_language(), process)
+    labels = _transition_labels.get(key)
+    if labels is None:
+        labels = _transition_labels[key] = render(process)
+    return labels
+
+
+def invalidate_transition_labels():
+    bump_version(TRANSITION_LABELS_VERSION_NAME)
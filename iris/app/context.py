@@ -1,11 +1,12 @@
+from django.utils.functional import SimpleLazyObject
 from django.utils.translation import get_language
 
-from iris.app.models import Station
+from iris.app.caching import get_station_list
 
 
 def stations(request):
     return {
-        "stations": Station.objects.all(),
+        "stations": SimpleLazyObject(get_station_list),
     }
 
 
@@ -0,0 +1,51 @@
+from django.db import transaction
+
+from iris.app.models import TaskEvent, TaskEventCursor
+
+EVENT_BATCH_SIZE = 1000
+EVENT_SEQUENCER = "iris:sequencer"
+
+
+def sequence_events(limit=EVENT_BATCH_SIZE):
+    with transaction.atomic():
+        sequencer, _created = TaskEventCursor.objects.select_for_update().get_or_create(
+            name=EVENT_SEQUENCER
+        )
+        events = list(TaskEvent.objects.unsequenced().only("pk")[:limit])
+        for sequence, event in enumerate(events, start=sequencer.position + 1):
+            event.sequence = sequence
+        if events:
+            TaskEvent.objects.bulk_update(events, ["sequence"])
+            sequencer.position = events[-1].sequence
+            sequencer.save(update_fields=["position", "modified"])
+    return events
+
+
+def read_events(after=0, limit=EVENT_BATCH_SIZE):
+    sequence_events()
+    return list(TaskEvent.objects.after(after)[:limit])
+
+
+def serialize_event(event):
+    return {
+        "sequence": event.sequence,
+        "created": event.created.isoformat(),
+        "kind": event.kind,
+        "item": event.item_id,
+        "task": event.task_id,
+        "record": event.record,
+    }
+
+
+def consume_events(name, handler, limit=EVENT_BATCH_SIZE):
+    sequence_events()
+    with transaction.atomic():
+        cursor, _created = TaskEventCursor.objects.select_for_update().get_or_create(
+            name=name
+        )
+        events = list(TaskEvent.objects.after(cursor.position)[:limit])
+        if events:
+            handler(events)
+            cursor.position = events[-1].sequence
+            cursor.save(update_fields=["position", "modified"])
+    return events
@@ -0,0 +1,146 @@
+import csv
+from datetime import timedelta
+from itertools import islice
+from json import dumps
+
+from django.db.models import F
+
+from asgiref.sync import sync_to_async
+
+from iris.app.models import Commit, Delay, Step, Suspension, Task
+
+EXPORT_FORMATS = ["csv", "json"]
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _task_columns(prefix):
+    return [
+        ("step", f"{prefix}step_transition__creates__name"),
+        ("item", f"{prefix}item"),
+        ("item_description", f"{prefix}item__description"),
+        ("process", f"{prefix}item__process__name"),
+    ]
+
+
+def _record_columns(*columns):
+    return [
+        ("id", "pk"),
+        ("created", "created"),
+        *columns,
+        ("task", "task"),
+        *_task_columns("task__"),
+        ("worker", "worker"),
+        ("worker_username", "worker__user__username"),
+        ("notes", "notes"),
+    ]
+
+
+EXPORTS = {
+    "commits": (
+        Commit,
+        "task__",
+        _record_columns(),
+    ),
+    "delays": (
+        Delay,
+        "task__",
+        _record_columns(("ends", "ends"), ("duration_seconds", "duration")),
+    ),
+    "suspensions": (
+        Suspension,
+        "task__",
+        _record_columns(("lifted_at", "lifted_at")),
+    ),
+    "tasks": (
+        Task,
+        "",
+        [
+            ("id", "pk"),
+            ("created", "created"),
+            ("state", "state"),
+            ("blocked_until", "blocked_until"),
+            *_task_columns(""),
+            ("committed_at", "commit__created"),
+            ("committed_by", "commit__worker__user__username"),
+        ],
+    ),
+}
+
+
+def get_export_queryset(kind, since=None, until=None, station=None):
+    model, task_prefix, columns = EXPORTS[kind]
+    queryset = model.objects.all()
+    if model is Delay:
+        queryset = queryset.annotate(ends=F("created") + F("duration"))
+    if since is not None:
+        queryset = queryset.filter(created__gte=since)
+    if until is not None:
+        queryset = queryset.filter(created__lt=until)
+    if station is not None:
+        queryset = queryset.filter(
+            **{f"{task_prefix}step_transition__creates__stations": station}
+        )
+    return queryset.order_by("pk").values_list(
+        *[lookup for _header, lookup in columns],
+        f"{task_prefix}step_transition__creates",
+    )
+
+
+def export_headers(kind):
+    return [header for header, _lookup in EXPORTS[kind][2]] + ["stations"]
+
+
+def get_step_stations():
+    stations = {}
+    for step, name in Step.stations.through.objects.order_by(
+        "station__name"
+    ).values_list("step", "station__name"):
+        stations[step] = f"{stations[step]}, {name}" if step in stations else name
+    return stations
+
+
+def format_value(value):
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def export_rows(kind, queryset):
+    headers = export_headers(kind)
+    step_stations = get_step_stations()
+    for *values, step in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield dict(
+            zip(headers, [*map(format_value, values), step_stations.get(step, "")])
+        )
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(kind, rows):
+    writer = csv.DictWriter(Echo(), export_headers(kind))
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_json(rows):
+    yield "["
+    separator = ""
+    for row in rows:
+        yield separator + dumps(row)
+        separator = ",\n"
+    yield "]\n"
+
+
+async def stream_async(chunks, size=EXPORT_CHUNK_SIZE):
+    read = sync_to_async(lambda: "".join(islice(chunks, size)))
+    try:
+        while chunk := await read():
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close)()
@@ -5,7 +5,8 @@ from django.core.validators import ValidationError
 from django.utils.timezone import now
 from django.utils.translation import gettext as _
 
-from iris.app.models import Delay, Item
+from iris.app.events import EVENT_BATCH_SIZE
+from iris.app.models import Delay, Item, Station
 
 
 class DelayModelForm(forms.ModelForm):
@@ -62,7 +63,7 @@ class DelayModelForm(forms.ModelForm):
 class CreateItemModelForm(forms.ModelForm):
     class Meta:
         model = Item
-        fields = ["process", "description", "notes", "quantity"]
+        fields = ["process", "description", "notes", "quantity", "due_date"]
 
     def save(self):
         instance = super().save()
@@ -70,6 +71,35 @@ class CreateItemModelForm(forms.ModelForm):
         return instance
 
 
+class ImportItemForm(forms.ModelForm):
+    process = forms.CharField()
+
+    class Meta:
+        model = Item
+        fields = ["description", "notes", "quantity", "has_priority", "due_date"]
+
+    def __init__(self, *args, processes, **kwargs):
+        self.processes = processes
+        super().__init__(*args, **kwargs)
+        self.fields["quantity"].required = False
+
+    def clean_quantity(self):
+        quantity = self.cleaned_data["quantity"]
+        return (
+            Item._meta.get_field("quantity").default if quantity is None else quantity
+        )
+
+    def clean_process(self):
+        process = self.processes.get(self.cleaned_data["process"].strip())
+        if process is None:
+            raise ValidationError(_("Unknown process."), code="invalid")
+        return process
+
+    def save(self, commit=False):
+        self.instance.process = self.cleaned_data["process"]
+        return super().save(commit=commit)
+
+
 class CancelItemForm(forms.ModelForm):
     reason = forms.CharField(required=True)
     time = forms.DateTimeField(required=True, initial=now)
@@ -84,3 +114,26 @@ class CancelItemForm(forms.ModelForm):
             self.cleaned_data["time"],
         )
         return super().save()
+
+
+class ExportFilterForm(forms.Form):
+    since = forms.DateTimeField(required=False)
+    until = forms.DateTimeField(required=False)
+    station = forms.ModelChoiceField(Station.objects.all(), required=False)
+
+
+class TaskEventFilterForm(forms.Form):
+    after = forms.IntegerField(min_value=0, required=False)
+    limit = forms.IntegerField(min_value=1, max_value=EVENT_BATCH_SIZE, required=False)
+
+    def clean_after(self):
+        return self.cleaned_data["after"] or 0
+
+    def clean_limit(self):
+        return self.cleaned_data["limit"] or EVENT_BATCH_SIZE
+
+
+class SummaryFilterForm(forms.Form):
+    station = forms.ModelChoiceField(Station.objects.all(), required=False)
+    since = forms.DateField(required=False)
+    until = forms.DateField(required=False)
@@ -0,0 +1,105 @@
+from collections import defaultdict
+
+from django.db.models import F
+
+from iris.app.models import Process, StepTransition, StepTransitionRequiredSteps
+
+_graphs = {}
+
+
+class ProcessGraph:
+    def __init__(self, transitions, requirements):
+        self.bits = {}
+        self.requirements = {}
+        self.required_by = {}
+        for transition in transitions:
+            self._add_transition(transition)
+        for transition, requirement in requirements:
+            self._add_transition(requirement)
+            self.requirements[transition] |= self.bits[requirement]
+            self.required_by[requirement].append(transition)
+        self.roots = [
+            transition
+            for transition in transitions
+            if self.requirements[transition] == 0
+        ]
+        self.depths = self._depths()
+
+    def _depths(self):
+        missing = defaultdict(int)
+        for required_by in self.required_by.values():
+            for transition in required_by:
+                missing[transition] += 1
+        depths = {transition: 0 for transition in self.bits}
+        ready = [transition for transition in self.bits if missing[transition] == 0]
+        while ready:
+            requirement = ready.pop()
+            for transition in self.required_by[requirement]:
+                depths[transition] = max(depths[transition], depths[requirement] + 1)
+                missing[transition] -= 1
+                if missing[transition] == 0:
+                    ready.append(transition)
+        return depths
+
+    def _add_transition(self, transition):
+        if transition not in self.bits:
+            self.bits[transition] = 1 << len(self.bits)
+            self.requirements[transition] = 0
+            self.required_by[transition] = []
+
+    def mask(self, transitions):
+        mask = 0
+        for transition in transitions:
+            mask |= self.bits.get(transition, 0)
+        return mask
+
+    def unlocked_by(self, transition, completed_mask):
+        return [
+            required_by
+            for required_by in self.required_by.get(transition, [])
+            if self.requirements[required_by] & ~completed_mask == 0
+        ]
+
+
+def get_process_graphs(processes):
+    versions = dict(
+        Process.objects.filter(pk__in=processes).values_list("pk", "graph_version")
+    )
+    missing = {
+        process
+        for process in processes
+        if _graphs.get(process, (None, None))[0] != versions.get(process)
+    }
+    if missing:
+        transitions = defaultdict(list)
+        for transition, process in StepTransition.objects.filter(
+            process__in=missing
+        ).values_list("pk", "process"):
+            transitions[process].append(transition)
+        requirements = defaultdict(list)
+        for (
+            transition,
+            process,
+            requirement,
+        ) in StepTransitionRequiredSteps.objects.filter(
+            step_transition__process__in=missing
+        ).values_list(
+            "step_transition", "step_transition__process", "requirement"
+        ):
+            requirements[process].append((transition, requirement))
+        for process in missing:
+            _graphs[process] = (
+                versions.get(process),
+                ProcessGraph(transitions[process], requirements[process]),
+            )
+    return {process: _graphs[process][1] for process in processes}
+
+
+def get_process_graph(process):
+    return get_process_graphs([process])[process]
+
+
+def invalidate_process_graphs(processes):
+    Process.objects.filter(pk__in=processes).update(
+        graph_version=F("graph_version") + 1
+    )
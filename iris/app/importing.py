@@ -0,0 +1,65 @@
+import csv
+import json
+from io import StringIO
+
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from iris.app.forms import ImportItemForm
+from iris.app.models import Item, Process
+
+IMPORT_FORMATS = ["csv", "json"]
+IMPORT_BATCH_SIZE = 500
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+def read_rows(content, format):
+    try:
+        content = content.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise ImportFormatError(_("Invalid UTF-8 text: {error}").format(error=e))
+    if format == "csv":
+        try:
+            return list(csv.DictReader(StringIO(content, newline="")))
+        except csv.Error as e:
+            raise ImportFormatError(_("Invalid CSV: {error}").format(error=e))
+    if format == "json":
+        try:
+            rows = json.loads(content)
+        except ValueError as e:
+            raise ImportFormatError(_("Invalid JSON: {error}").format(error=e))
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise ImportFormatError(_("The JSON import must be a list of objects."))
+        return rows
+    raise ImportFormatError(_("Unsupported import format."))
+
+
+def get_import_processes():
+    processes = {}
+    for process in Process.objects.all():
+        processes.setdefault(process.name, process)
+        processes[str(process.pk)] = process
+    return processes
+
+
+def import_items(rows, dry_run=False):
+    processes = get_import_processes()
+    items = []
+    errors = []
+    for number, row in enumerate(rows, start=1):
+        form = ImportItemForm(
+            {key: value for key, value in row.items() if value is not None},
+            processes=processes,
+        )
+        if form.is_valid():
+            items.append(form.save())
+        else:
+            errors.append({"row": number, "errors": form.errors.get_json_data()})
+    if items and not dry_run:
+        with transaction.atomic():
+            items = Item.objects.bulk_create(items, batch_size=IMPORT_BATCH_SIZE)
+            Item.objects.filter(pk__in=[item.pk for item in items]).spawn_tasks()
+    return items, errors
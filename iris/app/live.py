@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextvars import Context
+from json import dumps, loads
+
+from django.conf import settings
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from iris.app.models import Task
+from iris.app.pagination import KeysetPaginationMixin
+
+logger = logging.getLogger(__name__)
+
+LIVE_STATUSES = ["pending", "delayed", "suspended"]
+LIVE_CHANNEL = "iris:station_feeds"
+LIVE_PAGE_SIZE = KeysetPaginationMixin.paginate_by
+KEEPALIVE_SECONDS = 30
+REFRESH_DELAY_SECONDS = 0.25
+RECONNECT_SECONDS = 5
+
+
+def format_event(name, data):
+    return f"event: {name}\ndata: {dumps(data)}\n\n"
+
+
+class StationFeeds:
+    def __init__(self, redis_url):
+        self.redis_url = redis_url
+        self.redis = None
+        self.loop = None
+        self.listener = None
+        self.subscribers = defaultdict(set)
+        self.task_ids = {}
+        self.stale_stations = set()
+        self.refresh_scheduled = False
+
+    def notify(self, stations):
+        if self.redis_url:
+            if self.redis is None:
+                self.redis = Redis.from_url(self.redis_url)
+            try:
+                self.redis.publish(LIVE_CHANNEL, dumps(sorted(stations)))
+            except RedisError:
+                logger.exception("Could not notify the live station feeds.")
+        elif self.loop is not None and self.subscribers:
+            self.loop.call_soon_threadsafe(
+                self._schedule_refresh, set(stations), context=Context()
+            )
+
+    async def _listen(self):
+        while True:
+            try:
+                async with AsyncRedis.from_url(self.redis_url) as redis:
+                    async with redis.pubsub() as pubsub:
+                        await pubsub.subscribe(LIVE_CHANNEL)
+                        self._schedule_refresh(
+                            {station for station, _status in self.subscribers}
+                        )
+                        async for message in pubsub.listen():
+                            if message["type"] == "message":
+                                self._schedule_refresh(set(loads(message["data"])))
+            except Exception:
+                logger.exception("Lost the live station feeds channel.")
+                await asyncio.sleep(RECONNECT_SECONDS)
+
+    def _schedule_refresh(self, stations):
+        self.stale_stations |= stations
+        if not self.refresh_scheduled:
+            self.refresh_scheduled = True
+            self.loop.create_task(self._refresh())
+
+    async def _query(self, station, status):
+        queryset = getattr(Task.objects.in_station(station), status)()
+        return [
+            pk
+            async for pk in queryset.in_dispatch_order().values_list("pk", flat=True)[
+                :LIVE_PAGE_SIZE
+            ]
+        ]
+
+    async def _refresh(self):
+        await asyncio.sleep(REFRESH_DELAY_SECONDS)
+        stations, self.stale_stations = self.stale_stations, set()
+        self.refresh_scheduled = False
+        for key in [key for key in self.subscribers if key[0] in stations]:
+            task_ids = await self._query(*key)
+            if task_ids != self.task_ids.get(key):
+                self.task_ids[key] = task_ids
+                for queue in list(self.subscribers.get(key, [])):
+                    queue.put_nowait(task_ids)
+
+    async def stream(self, station, status):
+        self.loop = asyncio.get_running_loop()
+        if self.redis_url and self.listener is None:
+            self.listener = self.loop.create_task(self._listen())
+        key = (station, status)
+        queue = asyncio.Queue()
+        if not self.subscribers[key]:
+            self.task_ids[key] = await self._query(station, status)
+        self.subscribers[key].add(queue)
+        try:
+            yield format_event("snapshot", {"tasks": self.task_ids[key]})
+            while True:
+                try:
+                    task_ids = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                else:
+                    yield format_event("tasks", {"tasks": task_ids})
+        finally:
+            self.subscribers[key].discard(queue)
+            if not self.subscribers[key]:
+                del self.subscribers[key]
+                self.task_ids.pop(key, None)
+
+
+station_feeds = StationFeeds(settings.IRIS_LIVE_REDIS_URL)
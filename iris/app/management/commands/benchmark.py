@@ -0,0 +1,188 @@
+import json
+from statistics import median
+from time import perf_counter
+
+import django
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, Q
+from django.test import Client
+from django.urls import reverse
+from django.utils.timezone import now
+
+from iris.app.models import (
+    Commit,
+    Delay,
+    Item,
+    Station,
+    Suspension,
+    Task,
+    TaskState,
+    Worker,
+)
+from iris.app.profiling import RequestProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Time and count the queries of the main screens and operations, emitting JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument(
+            "--warmup", type=int, default=1, help="Untimed runs before measuring."
+        )
+        parser.add_argument(
+            "--username", help="Superuser to run as. Defaults to the first one."
+        )
+        parser.add_argument("--label", default="", help="Release label for the report.")
+        parser.add_argument("--output", help="Write the report to this file.")
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="Only run the benchmark with this name. Can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("Repeat must be at least 1.")
+        self.repeat = options["repeat"]
+        self.warmup = options["warmup"]
+        self.client = Client(SERVER_NAME=self.get_host())
+        self.client.force_login(self.get_user(options["username"]))
+        only = set(options["only"])
+        results = [
+            self.measure_view(name, url)
+            for name, url in self.get_urls()
+            if not only or name in only
+        ]
+        if not only or "commit_and_consolidate" in only:
+            results.append(self.measure_commit())
+        report = {
+            "label": options["label"],
+            "date": now().isoformat(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+            "conn_health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+            "pool": connection.settings_dict["OPTIONS"].get("pool", False),
+            "dataset": {
+                "items": Item.objects.count(),
+                "tasks": Task.objects.count(),
+                "commits": Commit.objects.count(),
+                "delays": Delay.objects.count(),
+                "suspensions": Suspension.objects.count(),
+                "stations": Station.objects.count(),
+            },
+            "results": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+        else:
+            self.stdout.write(output)
+
+    def get_host(self):
+        for host in settings.ALLOWED_HOSTS:
+            if host != "*":
+                return host.lstrip(".")
+        if not settings.DEBUG:
+            raise CommandError("Add the benchmark host to ALLOWED_HOSTS.")
+        return "localhost"
+
+    def get_user(self, username):
+        users = get_user_model().objects.filter(is_superuser=True, is_active=True)
+        if username:
+            users = users.filter(username=username)
+        user = users.order_by("pk").first()
+        if user is None:
+            raise CommandError("No active superuser to run the benchmark as.")
+        return user
+
+    def get_urls(self):
+        station = (
+            Station.objects.annotate(
+                pending=Count(
+                    "steps__created_by__tasks",
+                    filter=Q(steps__created_by__tasks__state=TaskState.PENDING),
+                )
+            )
+            .order_by("-pending", "pk")
+            .first()
+        )
+        urls = []
+        if station is not None:
+            urls.append(("station_pending", reverse("iris:station", args=[station.pk])))
+        urls += [
+            ("issues", reverse("iris:issues")),
+            ("item_list", reverse("iris:item_list")),
+        ]
+        for model in admin.site._registry:
+            opts = model._meta
+            if opts.app_label == "iris":
+                urls.append(
+                    (
+                        f"admin_{opts.model_name}_changelist",
+                        reverse(f"admin:{opts.app_label}_{opts.model_name}_changelist"),
+                    )
+                )
+        return urls
+
+    def check_status(self, name, status):
+        if status is None or not 200 <= status < 300:
+            raise CommandError(f"The {name} benchmark answered {status}.")
+
+    def run(self, name, func, url=""):
+        for _ in range(self.warmup):
+            self.check_status(name, func())
+            close_old_connections()
+        timings = []
+        for _ in range(self.repeat):
+            profile = RequestProfile(0)
+            with connection.execute_wrapper(profile):
+                start = perf_counter()
+                status = func()
+                timings.append((perf_counter() - start) * 1000)
+            close_old_connections()
+            self.check_status(name, status)
+        return {
+            "name": name,
+            "url": url,
+            "status": status,
+            "queries": profile.queries,
+            "sql_ms": round(profile.sql_time * 1000, 3),
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(median(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+
+    def measure_view(self, name, url):
+        return self.run(name, lambda: self.client.get(url).status_code, url)
+
+    def measure_commit(self):
+        worker = Worker.objects.order_by("pk").first()
+        if worker is None:
+            raise CommandError("No worker to commit the tasks as.")
+        tasks = iter(
+            Task.objects.filter(state=TaskState.PENDING, item__cancel_time__isnull=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)[: self.warmup + self.repeat]
+        )
+
+        def commit():
+            task = next(tasks, None)
+            if task is None:
+                raise CommandError("Not enough pending tasks to commit.")
+            with transaction.atomic():
+                commit = Commit.objects.create(task_id=task, worker=worker)
+                commit.spawn_and_consolidate_tasks()
+                transaction.set_rollback(True)
+            return 201
+
+        return self.run("commit_and_consolidate", commit)
@@ -0,0 +1,241 @@
+from datetime import timedelta
+from random import Random
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.timezone import now
+
+from iris.app.caching import invalidate_station_list, invalidate_station_tasks
+from iris.app.models import (
+    Commit,
+    Delay,
+    Item,
+    Process,
+    Station,
+    Step,
+    StepTransition,
+    StepTransitionRequiredSteps,
+    Suspension,
+    Task,
+    TaskEvent,
+    TaskEventKind,
+    Worker,
+)
+
+BATCH_SIZE = 1000
+MAX_GAP = timedelta(days=2)
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic workshop with processes, stations, items and task histories."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=5)
+        parser.add_argument(
+            "--depth", type=int, default=4, help="Levels of each process DAG."
+        )
+        parser.add_argument(
+            "--width", type=int, default=3, help="Step transitions per DAG level."
+        )
+        parser.add_argument("--stations", type=int, default=8)
+        parser.add_argument("--workers", type=int, default=10)
+        parser.add_argument("--items", type=int, default=1000)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Spread item creation over this period.",
+        )
+        parser.add_argument(
+            "--commit-ratio",
+            type=float,
+            default=0.6,
+            help="Chance of committing each open task on every history round.",
+        )
+        parser.add_argument("--delay-ratio", type=float, default=0.1)
+        parser.add_argument("--suspension-ratio", type=float, default=0.05)
+        parser.add_argument("--cancel-ratio", type=float, default=0.02)
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument("--prefix", default="Synthetic")
+
+    def handle(self, *args, **options):
+        if min(options["processes"], options["depth"], options["width"]) < 1:
+            raise CommandError("Processes, depth and width must be at least 1.")
+        if options["stations"] < 1 or options["workers"] < 1:
+            raise CommandError("At least one station and one worker are needed.")
+        self.random = Random(options["seed"])
+        self.prefix = options["prefix"]
+        self.start = now()
+        with transaction.atomic():
+            stations = self.create_stations(options["stations"])
+            workers = self.create_workers(options["workers"])
+            processes = [
+                self.create_process(n, options["depth"], options["width"], stations)
+                for n in range(options["processes"])
+            ]
+            items = self.create_items(processes, options["items"], options["days"])
+            self.items = Item.objects.filter(pk__in=[item.pk for item in items])
+            for _round in range(options["depth"]):
+                self.commit_tasks(workers, options["commit_ratio"])
+            self.delay_tasks(workers, options["delay_ratio"])
+            self.suspend_tasks(workers, options["suspension_ratio"])
+            self.cancel_items(options["cancel_ratio"])
+            Task.objects.filter(item__in=self.items).refresh_state()
+            self.items.refresh_counters()
+        invalidate_station_list()
+        invalidate_station_tasks([station.pk for station in stations])
+        tasks = Task.objects.filter(item__in=self.items).count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(processes)} processes, {len(stations)} stations, "
+                f"{len(items)} items and {tasks} tasks."
+            )
+        )
+
+    def after(self, moment):
+        return moment + min(MAX_GAP, (self.start - moment) / 2) * self.random.random()
+
+    def create_stations(self, count):
+        return Station.objects.bulk_create(
+            Station(name=f"{self.prefix} station {n + 1}") for n in range(count)
+        )
+
+    def create_workers(self, count):
+        User = get_user_model()
+        suffix = now().strftime("%Y%m%d%H%M%S")
+        users = User.objects.bulk_create(
+            User(username=f"{self.prefix.lower()}-{suffix}-{n + 1}")
+            for n in range(count)
+        )
+        return Worker.objects.bulk_create(Worker(user=user) for user in users)
+
+    def create_process(self, number, depth, width, stations):
+        process = Process.objects.create(name=f"{self.prefix} process {number + 1}")
+        steps = Step.objects.bulk_create(
+            Step(name=f"{process.name} step {level + 1}.{n + 1}")
+            for level in range(depth)
+            for n in range(width)
+        )
+        Step.stations.through.objects.bulk_create(
+            Step.stations.through(step=step, station=station)
+            for step in steps
+            for station in self.random.sample(
+                stations, self.random.randint(1, min(2, len(stations)))
+            )
+        )
+        transitions = StepTransition.objects.bulk_create(
+            StepTransition(process=process, creates=step) for step in steps
+        )
+        levels = [transitions[n : n + width] for n in range(0, len(transitions), width)]
+        StepTransitionRequiredSteps.objects.bulk_create(
+            StepTransitionRequiredSteps(
+                step_transition=transition, requirement=requirement
+            )
+            for previous, level in zip(levels, levels[1:])
+            for transition in level
+            for requirement in self.random.sample(
+                previous, self.random.randint(1, min(2, len(previous)))
+            )
+        )
+        return process
+
+    def create_items(self, processes, count, days):
+        items = Item.objects.bulk_create(
+            (
+                Item(
+                    process=self.random.choice(processes),
+                    description=f"{self.prefix} item {n + 1}",
+                    quantity=self.random.randint(1, 20),
+                    has_priority=self.random.random() < 0.1,
+                )
+                for n in range(count)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        for item in items:
+            item.created = self.start - timedelta(
+                seconds=self.random.randint(0, days * 86400)
+            )
+        Item.objects.bulk_update(items, ["created"], batch_size=BATCH_SIZE)
+        self.last_changes = {item.pk: item.created for item in items}
+        self.open_tasks = {}
+        tasks = Item.objects.filter(pk__in=[item.pk for item in items]).spawn_tasks()
+        self.backdate_tasks(tasks)
+        return items
+
+    def backdate_tasks(self, tasks):
+        for task in tasks:
+            task.created = self.last_changes[task.item_id]
+            self.open_tasks[task.pk] = (task.item_id, task.created)
+        Task.objects.bulk_update(tasks, ["created"], batch_size=BATCH_SIZE)
+
+    def pick_open_tasks(self, ratio):
+        return {
+            task: self.open_tasks[task] for task in self.pick(self.open_tasks, ratio)
+        }
+
+    def pick(self, tasks, ratio):
+        return [task for task in tasks if self.random.random() < ratio]
+
+    def commit_tasks(self, workers, ratio):
+        tasks = self.pick_open_tasks(ratio)
+        commits = Commit.objects.bulk_create(
+            (
+                Commit(task_id=task, worker=self.random.choice(workers))
+                for task in tasks
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        for commit in commits:
+            item, created = self.open_tasks.pop(commit.task_id)
+            commit.created = self.after(created)
+            self.last_changes[item] = max(self.last_changes[item], commit.created)
+        Commit.objects.bulk_update(commits, ["created"], batch_size=BATCH_SIZE)
+        self.backdate_tasks(
+            Commit.objects.filter(
+                pk__in=[commit.pk for commit in commits]
+            ).spawn_and_consolidate_tasks()
+        )
+
+    def delay_tasks(self, workers, ratio):
+        tasks = self.pick_open_tasks(ratio)
+        delays = [
+            Delay(
+                task_id=task,
+                worker=self.random.choice(workers),
+                duration=timedelta(hours=self.random.randint(1, 72)),
+            )
+            for task in tasks
+        ]
+        delays = Delay.objects.bulk_create(delays, batch_size=BATCH_SIZE)
+        for delay in delays:
+            delay.created = self.after(tasks[delay.task_id][1])
+            delay.expired = delay.created + delay.duration <= self.start
+        Delay.objects.bulk_update(delays, ["created", "expired"], batch_size=BATCH_SIZE)
+
+    def suspend_tasks(self, workers, ratio):
+        tasks = self.pick_open_tasks(ratio)
+        suspensions = Suspension.objects.bulk_create(
+            (
+                Suspension(task_id=task, worker=self.random.choice(workers))
+                for task in tasks
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        for suspension in suspensions:
+            suspension.created = self.after(tasks[suspension.task_id][1])
+            if self.random.random() < 0.5:
+                suspension.lifted_at = self.after(suspension.created)
+        Suspension.objects.bulk_update(
+            suspensions, ["created", "lifted_at"], batch_size=BATCH_SIZE
+        )
+
+    def cancel_items(self, ratio):
+        items = self.pick(list(self.items.values_list("pk", flat=True)), ratio)
+        Item.objects.filter(pk__in=items).update(
+            cancel_time=now(), cancel_reason=f"{self.prefix} cancelation"
+        )
+        TaskEvent.objects.log(
+            TaskEventKind.ITEM_CANCELED, [(item, None, None) for item in items]
+        )
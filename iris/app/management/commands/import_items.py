@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from iris.app.importing import (
+    IMPORT_FORMATS,
+    ImportFormatError,
+    import_items,
+    read_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Import items from a CSV or JSON file and spawn their root tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="File format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only validate the rows."
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        try:
+            rows = read_rows(path.read_bytes(), format)
+        except (OSError, ImportFormatError) as e:
+            raise CommandError(e)
+        items, errors = import_items(rows, dry_run=options["dry_run"])
+        for error in errors:
+            messages = "; ".join(
+                f"{field}: {' '.join(e['message'] for e in field_errors)}"
+                for field, field_errors in error["errors"].items()
+            )
+            self.stderr.write(f"Row {error['row']}: {messages}")
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {len(items)} items, {len(errors)} rows with errors."
+            )
+        )
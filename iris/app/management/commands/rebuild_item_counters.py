@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from iris.app.models import Item
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored item task counters from the existing tasks and commits."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "items", nargs="*", type=int, help="Only rebuild the items with these IDs."
+        )
+
+    def handle(self, *args, **options):
+        items = Item.objects.all()
+        if options["items"]:
+            items = items.filter(pk__in=options["items"])
+        with transaction.atomic():
+            updated = items.refresh_counters()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the counters of {updated} items.")
+        )
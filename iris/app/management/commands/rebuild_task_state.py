@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from iris.app.models import Task
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored task state columns from the commit, delay and suspension history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "tasks", nargs="*", type=int, help="Only rebuild the tasks with these IDs."
+        )
+
+    def handle(self, *args, **options):
+        tasks = Task.objects.all()
+        if options["tasks"]:
+            tasks = tasks.filter(pk__in=options["tasks"])
+        with transaction.atomic():
+            updated = tasks.refresh_state()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the state of {updated} tasks."))
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from iris.app.scheduling import DelayScheduler, expire_delays
+
+
+class Command(BaseCommand):
+    help = "Expire the delays as they end, returning their tasks to the queues."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Expire the delays that have already ended and exit.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=settings.IRIS_DELAY_SCHEDULER_INTERVAL,
+            help="Maximum seconds between checks for delays created elsewhere.",
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            tasks = expire_delays()
+            self.stdout.write(
+                self.style.SUCCESS(f"Expired the delays of {len(tasks)} tasks.")
+            )
+            return
+        scheduler = DelayScheduler(options["interval"])
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            pass
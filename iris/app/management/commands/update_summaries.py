@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from iris.app.analytics import update_summaries
+
+
+class Command(BaseCommand):
+    help = "Roll the task, commit, delay and suspension history into daily summaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild every day instead of only the days with changes.",
+        )
+
+    def handle(self, *args, **options):
+        run = update_summaries(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"Summarized {run.days} days."))
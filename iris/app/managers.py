@@ -1,71 +1,311 @@
-from django.db.models import Count, F, Max, Q, QuerySet
+from collections import defaultdict
+from datetime import date
+
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    TextChoices,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import GreaterThan
 from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+DISPATCH_ORDERING = [
+    "-dispatch_priority",
+    "dispatch_due_date",
+    "dispatch_item_created",
+    "dispatch_depth",
+    "pk",
+]
+
+
+def dispatch_fields(graph, transition, has_priority, due_date, item_created):
+    return {
+        "dispatch_priority": has_priority,
+        "dispatch_due_date": date.max if due_date is None else due_date,
+        "dispatch_item_created": item_created,
+        "dispatch_depth": graph.depths.get(transition, 0),
+    }
 
 
 class ItemQuerySet(QuerySet):
     def pending(self):
-        return (
-            self.annotate(
-                number_of_tasks=Count("tasks"), number_of_commits=Count("tasks__commit")
-            )
-            .filter(cancel_time__isnull=True)
-            .exclude(number_of_tasks=F("number_of_commits"))
+        return self.filter(cancel_time__isnull=True).exclude(
+            task_count=F("committed_count")
         )
 
     def completed(self):
-        return self.annotate(
-            number_of_tasks=Count("tasks"), number_of_commits=Count("tasks__commit")
-        ).filter(number_of_tasks=F("number_of_commits"))
+        return self.filter(task_count=F("committed_count"))
 
     def canceled(self):
         return self.filter(cancel_time__isnull=False)
 
+    def increment_counters(self, field, amounts):
+        items_by_amount = defaultdict(list)
+        for item, amount in amounts.items():
+            items_by_amount[amount].append(item)
+        for amount, items in items_by_amount.items():
+            self.filter(pk__in=items).update(**{field: F(field) + amount})
+
+    def refresh_counters(self):
+        from iris.app.models import Task
+
+        tasks = Task.objects.filter(item=OuterRef("pk")).order_by().values("item")
+        return self.update(
+            task_count=Coalesce(
+                Subquery(tasks.annotate(count=Count("pk")).values("count")), 0
+            ),
+            committed_count=Coalesce(
+                Subquery(
+                    tasks.filter(commit__isnull=False)
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            ),
+        )
+
+    def spawn_tasks(self):
+        from iris.app.graph import get_process_graphs
+        from iris.app.models import Task
+        from iris.app.signals import tasks_spawned
+
+        items = list(
+            self.values_list("pk", "process", "has_priority", "due_date", "created")
+        )
+        graphs = get_process_graphs({process for _item, process, *_ in items})
+        tasks = Task.objects.bulk_create(
+            [
+                Task(
+                    item_id=item,
+                    step_transition_id=transition,
+                    **dispatch_fields(graphs[process], transition, *dispatch),
+                )
+                for item, process, *dispatch in items
+                for transition in graphs[process].roots
+            ]
+        )
+        tasks_spawned.send(sender=Task, tasks=tasks)
+        return tasks
+
+
+class TaskState(TextChoices):
+    PENDING = "pending", _("pending")
+    DELAYED = "delayed", _("delayed")
+    SUSPENDED = "suspended", _("suspended")
+    COMPLETED = "completed", _("completed")
+
 
 class TaskQuerySet(QuerySet):
     def in_station(self, station):
         return self.filter(step_transition__creates__stations=station)
 
-    def pending(self):
-        return (
-            self.filter(commit__isnull=True, item__cancel_time__isnull=True)
-            .annotate(
-                max_delay=Max(F("delays__created") + F("delays__duration")),
-            )
-            .filter(Q(max_delay__isnull=True) | (Q(max_delay__lt=now())))
-            .exclude(
-                Q(suspensions__isnull=False) & Q(suspensions__lifted_at__isnull=True)
+    def with_state(self):
+        from iris.app.models import Delay
+
+        return self.select_related(
+            "item", "step_transition__creates", "commit", "active_suspension"
+        ).prefetch_related(
+            Prefetch(
+                "delays",
+                queryset=Delay.objects.in_effect().order_by("created"),
+                to_attr="delays_in_effect",
             )
         )
 
+    def in_dispatch_order(self):
+        return self.order_by(*DISPATCH_ORDERING)
+
+    def pending(self):
+        return self.filter(state=TaskState.PENDING, item__cancel_time__isnull=True)
+
     def completed(self):
-        return self.filter(commit__isnull=False)
+        return self.filter(state=TaskState.COMPLETED)
 
     def delayed(self):
-        return self.annotate(
-            max_delay=Max(F("delays__created") + F("delays__duration")),
-        ).filter(Q(max_delay__isnull=False) & (Q(max_delay__gt=now())))
+        return self.filter(blocked_until__isnull=False)
 
     def suspended(self):
+        return self.filter(active_suspension__isnull=False)
+
+    def with_issues(self):
         return self.filter(
-            Q(suspensions__isnull=False) & Q(suspensions__lifted_at__isnull=True)
+            Q(blocked_until__isnull=False) | Q(active_suspension__isnull=False)
         )
 
-    def with_issues(self):
-        return self.annotate(
-            max_delay=Max(F("delays__created") + F("delays__duration")),
-        ).filter(
-            Q(max_delay__isnull=False) & (Q(max_delay__gt=now()))
-            | Q(suspensions__isnull=False) & Q(suspensions__lifted_at__isnull=True)
+    def refresh_state(self):
+        from iris.app.models import Commit, Delay, Suspension
+
+        blocked_until = Subquery(
+            Delay.objects.filter(task=OuterRef("pk"), expired=False)
+            .order_by()
+            .values("task")
+            .annotate(ends=Max(F("created") + F("duration")))
+            .values("ends")
+        )
+        active_suspensions = Suspension.objects.filter(
+            task=OuterRef("pk"), lifted_at__isnull=True
+        )
+        return self.update(
+            blocked_until=Case(
+                When(GreaterThan(blocked_until, Value(now())), then=blocked_until),
+                default=None,
+            ),
+            active_suspension=Subquery(
+                active_suspensions.order_by("-created").values("pk")[:1]
+            ),
+            state=Case(
+                When(
+                    Exists(Commit.objects.filter(task=OuterRef("pk"))),
+                    then=Value(TaskState.COMPLETED),
+                ),
+                When(Exists(active_suspensions), then=Value(TaskState.SUSPENDED)),
+                When(
+                    GreaterThan(blocked_until, Value(now())),
+                    then=Value(TaskState.DELAYED),
+                ),
+                default=Value(TaskState.PENDING),
+            ),
         )
 
+    def _dispatch_depth(self):
+        from iris.app.graph import get_process_graphs
 
-class DelayQuerySet(QuerySet):
+        processes = set(
+            self.order_by()
+            .values_list("step_transition__process", flat=True)
+            .distinct()
+        )
+        depths = [
+            When(step_transition=transition, then=Value(depth))
+            for graph in get_process_graphs(processes).values()
+            for transition, depth in graph.depths.items()
+            if depth
+        ]
+        return Case(*depths, default=Value(0))
+
+    def refresh_dispatch(self):
+        from iris.app.models import Item
+
+        item = Item.objects.filter(pk=OuterRef("item"))
+        return self.update(
+            dispatch_priority=Subquery(item.values("has_priority")),
+            dispatch_due_date=Coalesce(
+                Subquery(item.values("due_date")), Value(date.max)
+            ),
+            dispatch_item_created=Subquery(item.values("created")),
+            dispatch_depth=self._dispatch_depth(),
+        )
+
+    def refresh_dispatch_depth(self):
+        depth = self._dispatch_depth()
+        return (
+            self.exclude(state=TaskState.COMPLETED)
+            .exclude(dispatch_depth=depth)
+            .update(dispatch_depth=depth)
+        )
+
+
+class TaskRecordQuerySet(QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        from iris.app.signals import tasks_changed
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        tasks_changed.send(
+            sender=self.model, tasks={obj.task_id for obj in objs}, records=objs
+        )
+        return objs
+
+
+class CommitQuerySet(TaskRecordQuerySet):
+    def spawn_and_consolidate_tasks(self):
+        from iris.app.graph import get_process_graphs
+        from iris.app.models import Task
+        from iris.app.signals import tasks_spawned
+
+        commits = list(
+            self.values_list(
+                "task__item",
+                "task__item__process",
+                "task__step_transition",
+                "task__item__has_priority",
+                "task__item__due_date",
+                "task__item__created",
+            )
+        )
+        processes = {item: process for item, process, *_ in commits}
+        graphs = get_process_graphs(set(processes.values()))
+        completed = defaultdict(int)
+        for item, transition in Task.objects.filter(
+            item__in=processes, commit__isnull=False
+        ).values_list("item", "step_transition"):
+            completed[item] |= graphs[processes[item]].mask([transition])
+        new_tasks = {}
+        for item, process, transition, *dispatch in commits:
+            graph = graphs[process]
+            for required_by in graph.unlocked_by(transition, completed[item]):
+                new_tasks[(item, required_by)] = Task(
+                    item_id=item,
+                    step_transition_id=required_by,
+                    **dispatch_fields(graph, required_by, *dispatch),
+                )
+        tasks = Task.objects.bulk_create(new_tasks.values())
+        tasks_spawned.send(sender=Task, tasks=tasks)
+        return tasks
+
+
+class DelayQuerySet(TaskRecordQuerySet):
     def in_effect(self):
-        return self.annotate(
-            delay_limit=F("created") + F("duration"),
-        ).filter(delay_limit__gt=now())
+        return self.filter(expired=False)
+
+    def expiring(self, until):
+        return (
+            self.in_effect()
+            .annotate(ends=F("created") + F("duration"))
+            .filter(ends__lte=until)
+        )
 
 
-class SuspensionQuerySet(QuerySet):
+class SuspensionQuerySet(TaskRecordQuerySet):
     def in_effect(self):
         return self.filter(Q(lifted_at__isnull=True))
+
+
+class TaskEventKind(TextChoices):
+    CREATED = "created", _("created")
+    COMMITTED = "committed", _("committed")
+    UNCOMMITTED = "uncommitted", _("uncommitted")
+    DELAYED = "delayed", _("delayed")
+    DELAY_ENDED = "delay_ended", _("delay ended")
+    DELAY_EXPIRED = "delay_expired", _("delay expired")
+    SUSPENDED = "suspended", _("suspended")
+    SUSPENSION_LIFTED = "suspension_lifted", _("suspension lifted")
+    ITEM_CANCELED = "item_canceled", _("item canceled")
+    ITEM_RESTORED = "item_restored", _("item restored")
+
+
+class TaskEventQuerySet(QuerySet):
+    def log(self, kind, rows):
+        return self.bulk_create(
+            [
+                self.model(kind=kind, item_id=item, task_id=task, record=record)
+                for item, task, record in rows
+            ]
+        )
+
+    def unsequenced(self):
+        return self.filter(sequence__isnull=True).order_by("pk")
+
+    def after(self, sequence):
+        return self.filter(sequence__gt=sequence).order_by("sequence")
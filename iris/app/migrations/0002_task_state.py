@@ -0,0 +1,86 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, Exists, F, Max, OuterRef, Subquery, Value, When
+from django.db.models.lookups import GreaterThan
+from django.utils.timezone import now
+
+
+def rebuild_task_state(apps, schema_editor):
+    Commit = apps.get_model("iris", "Commit")
+    Delay = apps.get_model("iris", "Delay")
+    Suspension = apps.get_model("iris", "Suspension")
+    Task = apps.get_model("iris", "Task")
+    blocked_until = Subquery(
+        Delay.objects.filter(task=OuterRef("pk"))
+        .order_by()
+        .values("task")
+        .annotate(ends=Max(F("created") + F("duration")))
+        .values("ends")
+    )
+    active_suspensions = Suspension.objects.filter(
+        task=OuterRef("pk"), lifted_at__isnull=True
+    )
+    Task.objects.update(
+        blocked_until=blocked_until,
+        active_suspension=Subquery(
+            active_suspensions.order_by("-created").values("pk")[:1]
+        ),
+        state=Case(
+            When(
+                Exists(Commit.objects.filter(task=OuterRef("pk"))),
+                then=Value("completed"),
+            ),
+            When(Exists(active_suspensions), then=Value("suspended")),
+            When(GreaterThan(blocked_until, Value(now())), then=Value("delayed")),
+            default=Value("pending"),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="active_suspension",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="iris.suspension",
+                verbose_name="active suspension",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="blocked_until",
+            field=models.DateTimeField(
+                db_index=True, editable=False, null=True, verbose_name="blocked until"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("pending", "pending"),
+                    ("delayed", "delayed"),
+                    ("suspended", "suspended"),
+                    ("completed", "completed"),
+                ],
+                db_index=True,
+                default="pending",
+                editable=False,
+                max_length=16,
+                verbose_name="state",
+            ),
+        ),
+        migrations.RunPython(rebuild_task_state, migrations.RunPython.noop),
+    ]
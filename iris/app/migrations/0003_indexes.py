@@ -0,0 +1,56 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0002_task_state"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="delay",
+            index=models.Index(
+                fields=["task", "created"], name="iris_delay_task_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                condition=models.Q(("cancel_time__isnull", True)),
+                fields=["created", "id"],
+                name="iris_item_not_canceled_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                fields=["cancel_time"], name="iris_item_cancel_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="suspension",
+            index=models.Index(
+                condition=models.Q(("lifted_at__isnull", True)),
+                fields=["task"],
+                name="iris_suspension_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("state__in", ["pending", "delayed"])),
+                fields=["created", "id"],
+                name="iris_task_open_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["step_transition", "state"],
+                name="iris_task_transition_state_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def rebuild_item_counters(apps, schema_editor):
+    Item = apps.get_model("iris", "Item")
+    Task = apps.get_model("iris", "Task")
+    tasks = Task.objects.filter(item=OuterRef("pk")).order_by().values("item")
+    Item.objects.update(
+        task_count=Coalesce(
+            Subquery(tasks.annotate(count=Count("pk")).values("count")), 0
+        ),
+        committed_count=Coalesce(
+            Subquery(
+                tasks.filter(commit__isnull=False)
+                .annotate(count=Count("pk"))
+                .values("count")
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0003_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="item",
+            name="committed_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="number of committed tasks"
+            ),
+        ),
+        migrations.AddField(
+            model_name="item",
+            name="task_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="number of tasks"
+            ),
+        ),
+        migrations.RunPython(rebuild_item_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                condition=models.Q(
+                    ("cancel_time__isnull", True),
+                    models.Q(
+                        ("task_count", models.F("committed_count")), _negated=True
+                    ),
+                ),
+                fields=["created", "id"],
+                name="iris_item_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                condition=models.Q(("task_count", models.F("committed_count"))),
+                fields=["created", "id"],
+                name="iris_item_completed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:29
+
+import datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0004_item_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SummaryRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started", models.DateTimeField(verbose_name="started")),
+                ("days", models.PositiveIntegerField(verbose_name="days summarized")),
+            ],
+            options={
+                "verbose_name": "summary run",
+                "verbose_name_plural": "summary runs",
+                "get_latest_by": "started",
+            },
+        ),
+        migrations.CreateModel(
+            name="DailySummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "tasks_created",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="tasks created"
+                    ),
+                ),
+                (
+                    "tasks_committed",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="tasks committed"
+                    ),
+                ),
+                (
+                    "lead_time",
+                    models.DurationField(
+                        default=datetime.timedelta, verbose_name="lead time"
+                    ),
+                ),
+                (
+                    "delays",
+                    models.PositiveIntegerField(default=0, verbose_name="delays"),
+                ),
+                (
+                    "delay_time",
+                    models.DurationField(
+                        default=datetime.timedelta, verbose_name="delay time"
+                    ),
+                ),
+                (
+                    "suspensions_lifted",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="suspensions lifted"
+                    ),
+                ),
+                (
+                    "suspension_time",
+                    models.DurationField(
+                        default=datetime.timedelta, verbose_name="suspension time"
+                    ),
+                ),
+                (
+                    "station",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="iris.station",
+                        verbose_name="station",
+                    ),
+                ),
+                (
+                    "step",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="iris.step",
+                        verbose_name="step",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "daily summary",
+                "verbose_name_plural": "daily summaries",
+                "indexes": [
+                    models.Index(
+                        fields=["day", "station"], name="iris_dailysummary_day_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("station", "step", "day"),
+                        name="iris_dailysummary_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:34
+
+import datetime
+from collections import defaultdict
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_dispatch_fields(apps, schema_editor):
+    Item = apps.get_model("iris", "Item")
+    StepTransitionRequiredSteps = apps.get_model("iris", "StepTransitionRequiredSteps")
+    Task = apps.get_model("iris", "Task")
+    item = Item.objects.filter(pk=OuterRef("item"))
+    Task.objects.update(
+        dispatch_priority=Subquery(item.values("has_priority")),
+        dispatch_due_date=Coalesce(
+            Subquery(item.values("due_date")), Value(datetime.date.max)
+        ),
+        dispatch_item_created=Subquery(item.values("created")),
+    )
+    required_by = defaultdict(list)
+    missing = defaultdict(int)
+    for transition, requirement in StepTransitionRequiredSteps.objects.values_list(
+        "step_transition", "requirement"
+    ):
+        required_by[requirement].append(transition)
+        missing[transition] += 1
+    depths = {}
+    ready = [transition for transition in required_by if missing[transition] == 0]
+    while ready:
+        requirement = ready.pop()
+        for transition in required_by[requirement]:
+            depths[transition] = max(
+                depths.get(transition, 0), depths.get(requirement, 0) + 1
+            )
+            missing[transition] -= 1
+            if missing[transition] == 0:
+                ready.append(transition)
+    transitions_by_depth = defaultdict(list)
+    for transition, depth in depths.items():
+        transitions_by_depth[depth].append(transition)
+    for depth, transitions in transitions_by_depth.items():
+        Task.objects.filter(step_transition__in=transitions).update(
+            dispatch_depth=depth
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0005_daily_summaries"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="iris_task_open_idx",
+        ),
+        migrations.AddField(
+            model_name="item",
+            name="due_date",
+            field=models.DateField(blank=True, null=True, verbose_name="due date"),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="dispatch_depth",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="process depth"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="dispatch_due_date",
+            field=models.DateField(
+                default=datetime.date(9999, 12, 31),
+                editable=False,
+                verbose_name="due date",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="dispatch_item_created",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="item creation time",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="dispatch_priority",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="has priority"
+            ),
+        ),
+        migrations.RunPython(fill_dispatch_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("state__in", ["pending", "delayed"])),
+                fields=[
+                    "-dispatch_priority",
+                    "dispatch_due_date",
+                    "dispatch_item_created",
+                    "dispatch_depth",
+                    "id",
+                ],
+                name="iris_task_dispatch_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:38
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils.timezone import now
+
+
+def expire_ended_delays(apps, schema_editor):
+    Delay = apps.get_model("iris", "Delay")
+    Task = apps.get_model("iris", "Task")
+    expiry = now()
+    Delay.objects.annotate(ends=F("created") + F("duration")).filter(
+        ends__lte=expiry
+    ).update(expired=True)
+    Task.objects.filter(blocked_until__lte=expiry, state="delayed").update(
+        state="pending"
+    )
+    Task.objects.filter(blocked_until__lte=expiry).update(blocked_until=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0006_dispatch_order"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="delay",
+            name="expired",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="expired"
+            ),
+        ),
+        migrations.RunPython(expire_ended_delays, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="delay",
+            index=models.Index(
+                condition=models.Q(("expired", False)),
+                fields=["created"],
+                name="iris_delay_unexpired_idx",
+            ),
+        ),
+    ]
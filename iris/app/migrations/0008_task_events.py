@@ -0,0 +1,102 @@
+# Generated by Django 6.0.3 on 2026-10-18 04:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0007_delay_expiry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskEventCursor",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=64, unique=True, verbose_name="name"),
+                ),
+                (
+                    "position",
+                    models.BigIntegerField(default=0, verbose_name="position"),
+                ),
+                (
+                    "modified",
+                    models.DateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+            ],
+            options={
+                "verbose_name": "task event cursor",
+                "verbose_name_plural": "task event cursors",
+            },
+        ),
+        migrations.CreateModel(
+            name="TaskEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("created", "created"),
+                            ("committed", "committed"),
+                            ("uncommitted", "uncommitted"),
+                            ("delayed", "delayed"),
+                            ("delay_ended", "delay ended"),
+                            ("delay_expired", "delay expired"),
+                            ("suspended", "suspended"),
+                            ("suspension_lifted", "suspension lifted"),
+                            ("item_canceled", "item canceled"),
+                            ("item_restored", "item restored"),
+                        ],
+                        max_length=32,
+                        verbose_name="kind",
+                    ),
+                ),
+                (
+                    "record",
+                    models.PositiveIntegerField(null=True, verbose_name="record"),
+                ),
+                (
+                    "item",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="iris.item",
+                        verbose_name="item",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="iris.task",
+                        verbose_name="task",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "task event",
+                "verbose_name_plural": "task events",
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.3 on 2026-10-18 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0008_task_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="process",
+            name="graph_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="graph version"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.3 on 2026-10-18 06:40
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def sequence_logged_events(apps, schema_editor):
+    TaskEvent = apps.get_model("iris", "TaskEvent")
+    TaskEventCursor = apps.get_model("iris", "TaskEventCursor")
+    TaskEvent.objects.update(sequence=F("id"))
+    TaskEventCursor.objects.update_or_create(
+        name="iris:sequencer",
+        defaults={
+            "position": TaskEvent.objects.aggregate(position=Max("id"))["position"] or 0
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0009_process_graph_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskevent",
+            name="sequence",
+            field=models.BigIntegerField(
+                editable=False, null=True, unique=True, verbose_name="sequence"
+            ),
+        ),
+        migrations.RunPython(sequence_logged_events, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="taskevent",
+            index=models.Index(
+                condition=models.Q(("sequence__isnull", True)),
+                fields=["id"],
+                name="iris_taskevent_unsequenced_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.3 on 2026-10-18 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0010_task_event_sequence"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="commit",
+            index=models.Index(fields=["created"], name="iris_commit_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="commit",
+            index=models.Index(fields=["modified"], name="iris_commit_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="delay",
+            index=models.Index(fields=["created"], name="iris_delay_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="delay",
+            index=models.Index(fields=["modified"], name="iris_delay_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="suspension",
+            index=models.Index(
+                condition=models.Q(("lifted_at__isnull", False)),
+                fields=["lifted_at"],
+                name="iris_suspension_lifted_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="suspension",
+            index=models.Index(
+                fields=["modified"], name="iris_suspension_modified_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["created"], name="iris_task_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["modified"], name="iris_task_modified_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.3 on 2026-10-18 08:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0011_summary_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("state", "completed")),
+                fields=["created", "id"],
+                name="iris_task_completed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.3 on 2026-10-18 08:20
+
+from datetime import UTC, datetime
+
+from django.db import migrations
+
+
+def delete_lock_row(apps, schema_editor):
+    SummaryRun = apps.get_model("iris", "SummaryRun")
+    SummaryRun.objects.filter(started=datetime(1970, 1, 1, tzinfo=UTC)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0012_task_completed_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_lock_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.3 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("iris", "0013_summary_lock"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dailysummary",
+            name="stale",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="stale"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailysummary",
+            index=models.Index(
+                condition=models.Q(("stale", True)),
+                fields=["day"],
+                name="iris_dailysummary_stale_idx",
+            ),
+        ),
+    ]
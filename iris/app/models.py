@@ -1,14 +1,20 @@
+from datetime import date, timedelta
+
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from iris.app.managers import (
+    CommitQuerySet,
     DelayQuerySet,
     ItemQuerySet,
     SuspensionQuerySet,
+    TaskEventKind,
+    TaskEventQuerySet,
     TaskQuerySet,
+    TaskState,
 )
 
 NOTES_PATH_LIMIT = 64
@@ -64,6 +70,19 @@ class TimestampMixin(models.Model):
         abstract = True
 
 
+class AtomicSaveMixin(models.Model):
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+
 class CancelableMixin(models.Model):
     cancel_time = models.DateTimeField(_("cancelation time"), editable=False, null=True)
     cancel_reason = models.CharField(
@@ -130,23 +149,65 @@ class Item(IrisStrMixin, TimestampMixin, CancelableMixin, NotesMixin, models.Mod
         _("quantity"), default=1, validators=[MinValueValidator(1)]
     )
     has_priority = models.BooleanField(_("has priority"), default=False)
+    due_date = models.DateField(_("due date"), null=True, blank=True)
+    task_count = models.PositiveIntegerField(
+        _("number of tasks"), default=0, editable=False
+    )
+    committed_count = models.PositiveIntegerField(
+        _("number of committed tasks"), default=0, editable=False
+    )
 
     objects = ItemQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("item")
         verbose_name_plural = _("items")
+        indexes = [
+            models.Index(
+                fields=["created", "id"],
+                name="iris_item_not_canceled_idx",
+                condition=models.Q(cancel_time__isnull=True),
+            ),
+            models.Index(fields=["cancel_time"], name="iris_item_cancel_time_idx"),
+            models.Index(
+                fields=["created", "id"],
+                name="iris_item_pending_idx",
+                condition=models.Q(cancel_time__isnull=True)
+                & ~models.Q(task_count=models.F("committed_count")),
+            ),
+            models.Index(
+                fields=["created", "id"],
+                name="iris_item_completed_idx",
+                condition=models.Q(task_count=models.F("committed_count")),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in ["task_count", "committed_count"]
+            ]
+        super().save(*args, **kwargs)
 
     @property
     def completed(self):
-        all_tasks = Task.objects.filter(item=self)
-        return all([task.completed for task in all_tasks])
+        return self.task_count == self.committed_count
+
+    def cancel(self, reason, datetime_=None):
+        with transaction.atomic():
+            super().cancel(reason, datetime_)
+            TaskEvent.objects.log(TaskEventKind.ITEM_CANCELED, [(self.pk, None, None)])
+
+    def restore(self):
+        with transaction.atomic():
+            super().restore()
+            TaskEvent.objects.log(TaskEventKind.ITEM_RESTORED, [(self.pk, None, None)])
 
     def spawn_tasks(self):
-        for transition in self.process.step_transitions.all():
-            if transition.required_steps.count() == 0:
-                new_task = Task(item=self, step_transition=transition)
-                new_task.save()
+        return Item.objects.filter(pk=self.pk).spawn_tasks()
 
 
 add_note_type("Item", "iris.app.Item")
@@ -154,6 +215,9 @@ add_note_type("Item", "iris.app.Item")
 
 class Process(IrisStrMixin, models.Model):
     name = models.CharField(_("name"), max_length=64)
+    graph_version = models.PositiveIntegerField(
+        _("graph version"), default=0, editable=False
+    )
 
     class Meta:
         verbose_name = _("process")
@@ -172,7 +236,7 @@ class Step(IrisStrMixin, models.Model):
         verbose_name_plural = _("steps")
 
 
-class Task(IrisStrMixin, TimestampMixin, models.Model):
+class Task(IrisStrMixin, TimestampMixin, AtomicSaveMixin, models.Model):
     step_transition = models.ForeignKey(
         "StepTransition",
         verbose_name=_("step transition"),
@@ -182,12 +246,69 @@ class Task(IrisStrMixin, TimestampMixin, models.Model):
     item = models.ForeignKey(
         "Item", verbose_name=_("item"), on_delete=models.RESTRICT, related_name="tasks"
     )
+    state = models.CharField(
+        _("state"),
+        max_length=16,
+        choices=TaskState.choices,
+        default=TaskState.PENDING,
+        editable=False,
+        db_index=True,
+    )
+    blocked_until = models.DateTimeField(
+        _("blocked until"), editable=False, null=True, db_index=True
+    )
+    active_suspension = models.ForeignKey(
+        "Suspension",
+        verbose_name=_("active suspension"),
+        on_delete=models.SET_NULL,
+        editable=False,
+        null=True,
+        related_name="+",
+    )
+    dispatch_priority = models.BooleanField(
+        _("has priority"), default=False, editable=False
+    )
+    dispatch_due_date = models.DateField(
+        _("due date"), default=date.max, editable=False
+    )
+    dispatch_item_created = models.DateTimeField(
+        _("item creation time"), default=now, editable=False
+    )
+    dispatch_depth = models.PositiveSmallIntegerField(
+        _("process depth"), default=0, editable=False
+    )
 
     objects = TaskQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("task")
         verbose_name_plural = _("tasks")
+        indexes = [
+            models.Index(
+                fields=[
+                    "-dispatch_priority",
+                    "dispatch_due_date",
+                    "dispatch_item_created",
+                    "dispatch_depth",
+                    "id",
+                ],
+                name="iris_task_dispatch_idx",
+                condition=models.Q(
+                    state__in=[TaskState.PENDING, TaskState.DELAYED],
+                ),
+            ),
+            models.Index(
+                fields=["step_transition", "state"],
+                name="iris_task_transition_state_idx",
+            ),
+            models.Index(
+                fields=["created", "id"],
+                name="iris_task_completed_idx",
+                condition=models.Q(state=TaskState.COMPLETED),
+            ),
+            models.Index(fields=["created"], name="iris_task_created_idx"),
+            models.Index(fields=["modified"], name="iris_task_modified_idx"),
+        ]
 
     @property
     def canceled(self):
@@ -199,25 +320,26 @@ class Task(IrisStrMixin, TimestampMixin, models.Model):
 
     @property
     def delayed(self):
-        return any(
-            [(delay.created + delay.duration) > now() for delay in self.delays.all()]
-        )
+        return self.blocked_until is not None
 
     @property
     def delayed_by(self):
-        for delay in self.delays.all():
-            if (delay.created + delay.duration) > now():
-                return delay
+        delays = getattr(self, "delays_in_effect", None)
+        if delays is None:
+            delays = self.delays.in_effect().order_by("created")
+        return next(iter(delays), None)
 
     @property
     def suspended(self):
-        return any([not suspension.lifted for suspension in self.suspensions.all()])
+        return self.active_suspension_id is not None
 
     @property
     def suspended_by(self):
-        for suspension in self.suspensions.all():
-            if not suspension.lifted:
-                return suspension
+        return self.active_suspension
+
+    def refresh_state(self):
+        Task.objects.filter(pk=self.pk).refresh_state()
+        self.refresh_from_db(fields=["state", "blocked_until", "active_suspension"])
 
 
 class StepTransition(IrisStrMixin, models.Model):
@@ -269,7 +391,7 @@ class Worker(IrisStrMixin, models.Model):
         verbose_name_plural = _("workers")
 
 
-class Commit(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
+class Commit(IrisStrMixin, TimestampMixin, NotesMixin, AtomicSaveMixin, models.Model):
     task = models.OneToOneField(
         "Task", verbose_name=_("task"), on_delete=models.CASCADE
     )
@@ -280,21 +402,18 @@ class Commit(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
         related_name="commits",
     )
 
+    objects = CommitQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("commit")
         verbose_name_plural = _("commits")
+        indexes = [
+            models.Index(fields=["created"], name="iris_commit_created_idx"),
+            models.Index(fields=["modified"], name="iris_commit_modified_idx"),
+        ]
 
     def spawn_and_consolidate_tasks(self):
-        for required_by in self.task.step_transition.required_by.all():
-            required_steps = required_by.required_steps.all()
-            required_tasks = Task.objects.filter(
-                item=self.task.item, step_transition__in=required_steps
-            )
-            if len(required_steps) == len(required_tasks) and all(
-                [task.completed for task in required_tasks]
-            ):
-                new_task = Task(item=self.task.item, step_transition=required_by)
-                new_task.save()
+        return Commit.objects.filter(pk=self.pk).spawn_and_consolidate_tasks()
 
 
 add_note_type("Commit", "iris.app.Commit")
@@ -317,7 +436,7 @@ class NoteTemplate(IrisStrMixin, models.Model):
         verbose_name_plural = _("note templates")
 
 
-class Delay(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
+class Delay(IrisStrMixin, TimestampMixin, NotesMixin, AtomicSaveMixin, models.Model):
     task = models.ForeignKey(
         "Task", verbose_name=_("task"), on_delete=models.CASCADE, related_name="delays"
     )
@@ -328,16 +447,33 @@ class Delay(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
         related_name="delays",
     )
     duration = models.DurationField(_("duration"))
+    expired = models.BooleanField(_("expired"), default=False, editable=False)
 
     objects = DelayQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("delay")
         verbose_name_plural = _("delays")
+        indexes = [
+            models.Index(
+                fields=["task", "created"], name="iris_delay_task_created_idx"
+            ),
+            models.Index(fields=["created"], name="iris_delay_created_idx"),
+            models.Index(fields=["modified"], name="iris_delay_modified_idx"),
+            models.Index(
+                fields=["created"],
+                name="iris_delay_unexpired_idx",
+                condition=models.Q(expired=False),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.expired = self.created is not None and self.ends <= now()
+        super().save(*args, **kwargs)
 
     @property
     def in_effect(self):
-        return self.created + self.duration > now()
+        return not self.expired and self.ends > now()
 
     @property
     def ends(self):
@@ -351,13 +487,20 @@ class Delay(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
                 )
             )
         self.duration = now() - self.created
-        self.save()
+        with transaction.atomic():
+            self.save()
+            TaskEvent.objects.log(
+                TaskEventKind.DELAY_ENDED,
+                [(self.task.item_id, self.task_id, self.pk)],
+            )
 
 
 add_note_type("Delay", "iris.app.Delay")
 
 
-class Suspension(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
+class Suspension(
+    IrisStrMixin, TimestampMixin, NotesMixin, AtomicSaveMixin, models.Model
+):
     task = models.ForeignKey(
         "Task",
         verbose_name=_("task"),
@@ -381,6 +524,19 @@ class Suspension(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
     class Meta:
         verbose_name = _("suspension")
         verbose_name_plural = _("suspensions")
+        indexes = [
+            models.Index(
+                fields=["task"],
+                name="iris_suspension_active_idx",
+                condition=models.Q(lifted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["lifted_at"],
+                name="iris_suspension_lifted_idx",
+                condition=models.Q(lifted_at__isnull=False),
+            ),
+            models.Index(fields=["modified"], name="iris_suspension_modified_idx"),
+        ]
 
     def lift(self, datetime_=None):
         if self.lifted:
@@ -392,7 +548,12 @@ class Suspension(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
         if datetime_ is None:
             datetime_ = now()
         self.lifted_at = datetime_
-        self.save()
+        with transaction.atomic():
+            self.save()
+            TaskEvent.objects.log(
+                TaskEventKind.SUSPENSION_LIFTED,
+                [(self.task.item_id, self.task_id, self.pk)],
+            )
 
     @property
     def lifted(self):
@@ -400,3 +561,102 @@ class Suspension(IrisStrMixin, TimestampMixin, NotesMixin, models.Model):
 
 
 add_note_type("Suspension", "iris.app.Suspension")
+
+
+class DailySummary(models.Model):
+    station = models.ForeignKey(
+        "Station",
+        verbose_name=_("station"),
+        on_delete=models.CASCADE,
+        related_name="daily_summaries",
+    )
+    step = models.ForeignKey(
+        "Step",
+        verbose_name=_("step"),
+        on_delete=models.CASCADE,
+        related_name="daily_summaries",
+    )
+    day = models.DateField(_("day"))
+    tasks_created = models.PositiveIntegerField(_("tasks created"), default=0)
+    tasks_committed = models.PositiveIntegerField(_("tasks committed"), default=0)
+    lead_time = models.DurationField(_("lead time"), default=timedelta)
+    delays = models.PositiveIntegerField(_("delays"), default=0)
+    delay_time = models.DurationField(_("delay time"), default=timedelta)
+    suspensions_lifted = models.PositiveIntegerField(_("suspensions lifted"), default=0)
+    suspension_time = models.DurationField(_("suspension time"), default=timedelta)
+    stale = models.BooleanField(_("stale"), default=False, editable=False)
+
+    class Meta:
+        verbose_name = _("daily summary")
+        verbose_name_plural = _("daily summaries")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["station", "step", "day"], name="iris_dailysummary_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["day", "station"], name="iris_dailysummary_day_idx"),
+            models.Index(
+                fields=["day"],
+                name="iris_dailysummary_stale_idx",
+                condition=models.Q(stale=True),
+            ),
+        ]
+
+
+class SummaryRun(models.Model):
+    started = models.DateTimeField(_("started"))
+    days = models.PositiveIntegerField(_("days summarized"))
+
+    class Meta:
+        verbose_name = _("summary run")
+        verbose_name_plural = _("summary runs")
+        get_latest_by = "started"
+
+
+class TaskEvent(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+    kind = models.CharField(_("kind"), max_length=32, choices=TaskEventKind.choices)
+    item = models.ForeignKey(
+        "Item",
+        verbose_name=_("item"),
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    task = models.ForeignKey(
+        "Task",
+        verbose_name=_("task"),
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    record = models.PositiveIntegerField(_("record"), null=True)
+    sequence = models.BigIntegerField(
+        _("sequence"), null=True, unique=True, editable=False
+    )
+
+    objects = TaskEventQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("task event")
+        verbose_name_plural = _("task events")
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(sequence__isnull=True),
+                name="iris_taskevent_unsequenced_idx",
+            ),
+        ]
+
+
+class TaskEventCursor(models.Model):
+    name = models.CharField(_("name"), max_length=64, unique=True)
+    position = models.BigIntegerField(_("position"), default=0)
+    modified = models.DateTimeField(_("modified"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("task event cursor")
+        verbose_name_plural = _("task event cursors")
@@ -0,0 +1,162 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from bisect import bisect_left, bisect_right
+from functools import partial
+from json import dumps, loads
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+from django.utils.translation import gettext as _
+
+
+class KeysetPage:
+    def __init__(self, object_list, has_next, has_previous, ordering):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.ordering = ordering
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next:
+            return encode_cursor(self.object_list[-1], self.ordering)
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous:
+            return encode_cursor(self.object_list[0], self.ordering)
+
+
+def _field_name(ordering_field):
+    return ordering_field.removeprefix("-")
+
+
+def encode_cursor(obj, ordering):
+    values = []
+    for ordering_field in ordering:
+        value = getattr(obj, _field_name(ordering_field))
+        values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+    return urlsafe_b64encode(dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, model, ordering):
+    try:
+        values = loads(urlsafe_b64decode(cursor.encode()))
+        if len(values) != len(ordering):
+            raise ValueError
+        return [
+            (
+                model._meta.pk
+                if _field_name(ordering_field) == "pk"
+                else model._meta.get_field(_field_name(ordering_field))
+            ).to_python(value)
+            for ordering_field, value in zip(ordering, values)
+        ]
+    except (BinasciiError, ValidationError, TypeError, ValueError):
+        raise Http404(_("Invalid page cursor."))
+
+
+def keyset_filter(ordering, values, forward=True):
+    condition = Q(pk__in=[])
+    for index in reversed(range(len(ordering))):
+        name = _field_name(ordering[index])
+        descending = ordering[index].startswith("-")
+        lookup = "lt" if descending == forward else "gt"
+        condition = Q(**{f"{name}__{lookup}": values[index]}) | (
+            Q(**{name: values[index]}) & condition
+        )
+    return condition
+
+
+def reverse_ordering(ordering):
+    return [
+        _field_name(field) if field.startswith("-") else f"-{field}"
+        for field in ordering
+    ]
+
+
+class Descending:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def sort_key(ordering, values):
+    return tuple(
+        Descending(value) if ordering_field.startswith("-") else value
+        for ordering_field, value in zip(ordering, values)
+    )
+
+
+class KeysetPaginationMixin:
+    paginate_by = 50
+    keyset_ordering = ["created", "pk"]
+
+    def get_keyset_ordering(self):
+        return self.keyset_ordering
+
+    def get_cursor(self):
+        after = self.request.GET.get("after")
+        before = self.request.GET.get("before")
+        return (after, True) if before is None else (before, False)
+
+    def paginate_keys(self, queryset, keys, page_size):
+        ordering = self.get_keyset_ordering()
+        cursor, forward = self.get_cursor()
+        key = partial(sort_key, ordering)
+        start = 0
+        if cursor is not None:
+            values = key(decode_cursor(cursor, queryset.model, ordering))
+            start = (bisect_right if forward else bisect_left)(keys, values, key=key)
+        if forward:
+            end = start + page_size
+            has_next, has_previous = end < len(keys), cursor is not None
+        else:
+            start, end = max(0, start - page_size), start
+            has_next, has_previous = True, start > 0
+        pks = [values[-1] for values in keys[start:end]]
+        objects = queryset.in_bulk(pks)
+        object_list = [objects[pk] for pk in pks if pk in objects]
+        page = KeysetPage(object_list, has_next, has_previous, ordering)
+        return (None, page, page.object_list, page.has_other_pages())
+
+    def paginate_queryset(self, queryset, page_size):
+        ordering = self.get_keyset_ordering()
+        cursor, forward = self.get_cursor()
+        queryset = queryset.order_by(
+            *(ordering if forward else reverse_ordering(ordering))
+        )
+        if cursor is not None:
+            values = decode_cursor(cursor, queryset.model, ordering)
+            queryset = queryset.filter(keyset_filter(ordering, values, forward))
+        object_list = list(queryset[: page_size + 1])
+        has_more = len(object_list) > page_size
+        object_list = object_list[:page_size]
+        if forward:
+            has_next, has_previous = has_more, cursor is not None
+        else:
+            object_list.reverse()
+            has_next, has_previous = True, has_more
+        page = KeysetPage(object_list, has_next, has_previous, ordering)
+        return (None, page, page.object_list, page.has_other_pages())
@@ -0,0 +1,136 @@
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from threading import Lock
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+PERCENTILES = [50, 90, 99]
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+class RequestProfile:
+    def __init__(self, slowest):
+        self.start = perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_start = None
+        self.template_time = 0.0
+        self.slowest = []
+        self.slowest_limit = slowest
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - start
+            self.queries += 1
+            self.sql_time += duration
+            if self.slowest_limit:
+                self.slowest.append((duration, sql))
+                self.slowest.sort(key=lambda statement: statement[0], reverse=True)
+                del self.slowest[self.slowest_limit :]
+
+    def start_rendering(self):
+        self.template_start = perf_counter()
+
+    def end_rendering(self, response):
+        if self.template_start is not None:
+            self.template_time += perf_counter() - self.template_start
+            self.template_start = None
+
+    def server_timing(self):
+        return ", ".join(
+            [
+                f'sql;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+                f"tpl;dur={self.template_time * 1000:.1f}",
+                f"total;dur={(perf_counter() - self.start) * 1000:.1f}",
+            ]
+        )
+
+
+class ProfilingStats:
+    def __init__(self):
+        self.lock = Lock()
+        self.samples = defaultdict(self._new_samples)
+        self.slowest = defaultdict(list)
+
+    def _new_samples(self):
+        return deque(maxlen=settings.IRIS_PROFILING_SAMPLES)
+
+    def record(self, view_name, profile):
+        sample = (
+            profile.queries,
+            profile.sql_time * 1000,
+            profile.template_time * 1000,
+            (perf_counter() - profile.start) * 1000,
+        )
+        with self.lock:
+            self.samples[view_name].append(sample)
+            slowest = self.slowest[view_name]
+            slowest.extend(profile.slowest)
+            slowest.sort(key=lambda statement: statement[0], reverse=True)
+            del slowest[settings.IRIS_PROFILING_SLOWEST :]
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.slowest.clear()
+
+    def summary(self):
+        with self.lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+            slowest = {name: list(values) for name, values in self.slowest.items()}
+        summary = {}
+        for name, values in sorted(samples.items()):
+            summary[name] = {"requests": len(values)}
+            for index, metric in enumerate(
+                ["queries", "sql_ms", "template_ms", "total_ms"]
+            ):
+                metric_values = [sample[index] for sample in values]
+                summary[name][metric] = {
+                    f"p{percent}": round(percentile(metric_values, percent), 3)
+                    for percent in PERCENTILES
+                } | {"max": round(max(metric_values), 3)}
+            summary[name]["slowest"] = [
+                {"ms": round(duration * 1000, 3), "sql": sql}
+                for duration, sql in slowest[name]
+            ]
+        return summary
+
+
+profiling_stats = ProfilingStats()
+
+
+class QueryProfilingMiddleware:
+    def __init__(self, get_response):
+        if not settings.IRIS_PROFILING:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile(settings.IRIS_PROFILING_SLOWEST)
+        request.iris_profile = profile
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile))
+            response = self.get_response(request)
+        match = request.resolver_match
+        profiling_stats.record(
+            match.view_name if match is not None else "<unresolved>", profile
+        )
+        response["Server-Timing"] = profile.server_timing()
+        return response
+
+    def process_template_response(self, request, response):
+        request.iris_profile.start_rendering()
+        response.add_post_render_callback(request.iris_profile.end_rendering)
+        return response
@@ -0,0 +1,94 @@
+import logging
+from threading import Event, Lock, Thread
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Min
+from django.utils.timezone import now
+
+from iris.app.models import Delay, TaskEvent, TaskEventKind
+
+logger = logging.getLogger(__name__)
+
+
+def expire_delays(until=None):
+    from iris.app.signals import tasks_changed
+
+    if until is None:
+        until = now()
+    with transaction.atomic():
+        delays = list(
+            Delay.objects.expiring(until)
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("task__item", "task", "pk")
+        )
+        if not delays:
+            return set()
+        Delay.objects.filter(pk__in=[pk for _item, _task, pk in delays]).update(
+            expired=True
+        )
+        TaskEvent.objects.log(TaskEventKind.DELAY_EXPIRED, delays)
+        tasks = {task for _item, task, _pk in delays}
+        tasks_changed.send(sender=Delay, tasks=tasks)
+    return tasks
+
+
+def get_next_expiry():
+    return (
+        Delay.objects.in_effect()
+        .annotate(ends=F("created") + F("duration"))
+        .aggregate(next_expiry=Min("ends"))["next_expiry"]
+    )
+
+
+class DelayScheduler:
+    def __init__(self, interval):
+        self.interval = interval
+        self.wakeup = Event()
+        self.stopped = Event()
+        self.lock = Lock()
+        self.thread = None
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.stopped.clear()
+                self.thread = Thread(
+                    target=self.run, name="iris-delay-scheduler", daemon=True
+                )
+                self.thread.start()
+
+    def stop(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        self.stopped.set()
+        self.wakeup.set()
+        if thread is not None:
+            thread.join()
+
+    def wake(self):
+        self.wakeup.set()
+
+    def tick(self):
+        self.wakeup.clear()
+        tasks = expire_delays()
+        if tasks:
+            logger.info("Expired the delays of %d tasks.", len(tasks))
+        next_expiry = get_next_expiry()
+        if next_expiry is None:
+            return self.interval
+        return min(self.interval, max(0, (next_expiry - now()).total_seconds()))
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                timeout = self.tick()
+            except Exception:
+                logger.exception("Could not expire the delays.")
+                timeout = self.interval
+            finally:
+                close_old_connections()
+            self.wakeup.wait(timeout)
+
+
+delay_scheduler = DelayScheduler(settings.IRIS_DELAY_SCHEDULER_INTERVAL)
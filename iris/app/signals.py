@@ -0,0 +1,282 @@
+from collections import Counter
+from datetime import date
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from iris.app.analytics import invalidate_record_summaries, invalidate_summaries
+from iris.app.caching import (
+    invalidate_station_list,
+    invalidate_station_tasks,
+    invalidate_transition_labels,
+)
+from iris.app.graph import invalidate_process_graphs
+from iris.app.live import station_feeds
+from iris.app.models import (
+    Commit,
+    Delay,
+    Item,
+    Process,
+    Station,
+    Step,
+    StepTransition,
+    StepTransitionRequiredSteps,
+    Suspension,
+    Task,
+    TaskEvent,
+    TaskEventKind,
+)
+from iris.app.scheduling import delay_scheduler
+
+tasks_spawned = Signal()
+tasks_changed = Signal()
+
+
+@receiver(post_save, sender=Commit)
+@receiver(post_delete, sender=Commit)
+@receiver(post_save, sender=Delay)
+@receiver(post_delete, sender=Delay)
+@receiver(post_save, sender=Suspension)
+@receiver(post_delete, sender=Suspension)
+def refresh_task_state(sender, instance, **kwargs):
+    Task.objects.filter(pk=instance.task_id).refresh_state()
+
+
+@receiver(tasks_changed)
+def refresh_changed_tasks_state(sender, tasks, **kwargs):
+    Task.objects.filter(pk__in=tasks).refresh_state()
+
+
+@receiver(post_save, sender=Delay)
+@receiver(tasks_changed, sender=Delay)
+def wake_delay_scheduler(sender, **kwargs):
+    transaction.on_commit(delay_scheduler.wake)
+
+
+@receiver(post_save, sender=StepTransition)
+@receiver(post_delete, sender=StepTransition)
+@receiver(post_save, sender=StepTransitionRequiredSteps)
+@receiver(post_delete, sender=StepTransitionRequiredSteps)
+@receiver(m2m_changed, sender=StepTransitionRequiredSteps)
+def invalidate_step_transitions(sender, instance, action="post_save", **kwargs):
+    if action.startswith("pre_"):
+        return
+    if isinstance(instance, StepTransitionRequiredSteps):
+        processes = list(
+            Process.objects.filter(
+                step_transitions=instance.step_transition_id
+            ).values_list("pk", flat=True)
+        )
+    else:
+        processes = [instance.process_id]
+    invalidate_process_graphs(processes)
+    transaction.on_commit(invalidate_transition_labels)
+    transaction.on_commit(partial(refresh_process_dispatch, processes))
+
+
+def refresh_process_dispatch(processes):
+    tasks = Task.objects.filter(step_transition__process__in=processes)
+    if tasks.refresh_dispatch_depth():
+        invalidate_stations_for(steps__created_by__process__in=processes)
+
+
+@receiver(post_save, sender=Task)
+def refresh_created_task_dispatch(sender, instance, created, **kwargs):
+    if created:
+        Task.objects.filter(pk=instance.pk).refresh_dispatch()
+
+
+@receiver(post_save, sender=Item)
+def refresh_item_tasks_dispatch(sender, instance, **kwargs):
+    Task.objects.filter(item=instance).update(
+        dispatch_priority=instance.has_priority,
+        dispatch_due_date=(
+            date.max if instance.due_date is None else instance.due_date
+        ),
+    )
+
+
+@receiver(post_save, sender=Step)
+@receiver(post_save, sender=Process)
+def invalidate_step_names(sender, **kwargs):
+    transaction.on_commit(invalidate_transition_labels)
+
+
+def refresh_stations(stations):
+    invalidate_station_tasks(stations)
+    station_feeds.notify(stations)
+
+
+def invalidate_stations_for(**station_lookup):
+    stations = set(
+        Station.objects.filter(**station_lookup).values_list("pk", flat=True)
+    )
+    if stations:
+        transaction.on_commit(partial(refresh_stations, stations))
+
+
+def invalidate_stations_for_tasks(**task_lookup):
+    invalidate_stations_for(
+        **{
+            f"steps__created_by__tasks__{lookup}": value
+            for lookup, value in task_lookup.items()
+        }
+    )
+
+
+@receiver(post_save, sender=Commit)
+@receiver(post_delete, sender=Commit)
+@receiver(post_save, sender=Delay)
+@receiver(post_delete, sender=Delay)
+@receiver(post_save, sender=Suspension)
+@receiver(post_delete, sender=Suspension)
+def invalidate_task_stations(sender, instance, **kwargs):
+    invalidate_stations_for_tasks(pk=instance.task_id)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_stations(sender, instance, **kwargs):
+    invalidate_stations_for(steps__created_by=instance.step_transition_id)
+
+
+@receiver(post_save, sender=Item)
+def invalidate_item_stations(sender, instance, **kwargs):
+    invalidate_stations_for_tasks(item=instance.pk)
+
+
+@receiver(tasks_spawned)
+def invalidate_spawned_task_stations(sender, tasks, **kwargs):
+    invalidate_stations_for_tasks(pk__in=[task.pk for task in tasks])
+
+
+@receiver(tasks_changed)
+def invalidate_changed_task_stations(sender, tasks, **kwargs):
+    invalidate_stations_for_tasks(pk__in=tasks)
+
+
+@receiver(post_save, sender=Station)
+@receiver(post_delete, sender=Station)
+@receiver(post_delete, sender=Step)
+@receiver(m2m_changed, sender=Step.stations.through)
+def invalidate_stations_list(sender, **kwargs):
+    transaction.on_commit(invalidate_station_list)
+
+
+@receiver(post_save, sender=Task)
+def count_created_task(sender, instance, created, **kwargs):
+    if created:
+        Item.objects.increment_counters("task_count", {instance.item_id: 1})
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    Item.objects.increment_counters("task_count", {instance.item_id: -1})
+
+
+@receiver(tasks_spawned)
+def count_spawned_tasks(sender, tasks, **kwargs):
+    Item.objects.increment_counters(
+        "task_count", Counter(task.item_id for task in tasks)
+    )
+
+
+@receiver(post_save, sender=Commit)
+def count_created_commit(sender, instance, created, **kwargs):
+    if created:
+        Item.objects.filter(tasks=instance.task_id).update(
+            committed_count=F("committed_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Commit)
+def count_deleted_commit(sender, instance, **kwargs):
+    Item.objects.filter(tasks=instance.task_id).update(
+        committed_count=F("committed_count") - 1
+    )
+
+
+@receiver(tasks_changed, sender=Commit)
+def count_created_commits(sender, tasks, **kwargs):
+    Item.objects.increment_counters(
+        "committed_count",
+        Counter(Task.objects.filter(pk__in=tasks).values_list("item", flat=True)),
+    )
+
+
+RECORD_EVENT_KINDS = {
+    Commit: TaskEventKind.COMMITTED,
+    Delay: TaskEventKind.DELAYED,
+    Suspension: TaskEventKind.SUSPENDED,
+}
+
+
+@receiver(post_save, sender=Task)
+def log_created_task(sender, instance, created, **kwargs):
+    if created:
+        TaskEvent.objects.log(
+            TaskEventKind.CREATED, [(instance.item_id, instance.pk, None)]
+        )
+
+
+@receiver(tasks_spawned)
+def log_spawned_tasks(sender, tasks, **kwargs):
+    TaskEvent.objects.log(
+        TaskEventKind.CREATED, [(task.item_id, task.pk, None) for task in tasks]
+    )
+
+
+@receiver(post_save, sender=Commit)
+@receiver(post_save, sender=Delay)
+@receiver(post_save, sender=Suspension)
+def log_created_record(sender, instance, created, **kwargs):
+    if created:
+        TaskEvent.objects.log(
+            RECORD_EVENT_KINDS[sender],
+            [(instance.task.item_id, instance.task_id, instance.pk)],
+        )
+
+
+@receiver(tasks_changed)
+def log_created_records(sender, records=(), **kwargs):
+    if records:
+        items = dict(
+            Task.objects.filter(
+                pk__in={record.task_id for record in records}
+            ).values_list("pk", "item")
+        )
+        TaskEvent.objects.log(
+            RECORD_EVENT_KINDS[sender],
+            [(items[record.task_id], record.task_id, record.pk) for record in records],
+        )
+
+
+@receiver(post_delete, sender=Commit)
+def log_deleted_commit(sender, instance, **kwargs):
+    TaskEvent.objects.log(
+        TaskEventKind.UNCOMMITTED,
+        [(instance.task.item_id, instance.task_id, instance.pk)],
+    )
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Commit)
+@receiver(post_delete, sender=Delay)
+@receiver(post_delete, sender=Suspension)
+def invalidate_deleted_record_summaries(sender, instance, **kwargs):
+    invalidate_record_summaries(instance)
+
+
+@receiver(m2m_changed, sender=Step.stations.through)
+def invalidate_step_station_summaries(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action.startswith("pre_"):
+        return
+    if reverse:
+        invalidate_summaries(Q(station=instance) | Q(step__in=pk_set or []))
+    else:
+        invalidate_summaries(step=instance)
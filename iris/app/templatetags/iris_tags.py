@@ -12,3 +12,15 @@ def make_item_title(item, chars=32):
         else " (" + Truncator(item.description).chars(chars) + ")"
     )
     return type(item)._meta.verbose_name + " #" + str(item.pk) + tail
+
+
+@register.filter
+def duration(value):
+    if value is None:
+        return "---"
+    seconds = round(value.total_seconds())
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    clock = f"{hours:02}:{minutes:02}:{seconds:02}"
+    return f"{days}d {clock}" if days else clock
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from iris.app.caching import invalidate_transition_labels
+from iris.app.models import (
+    Commit,
+    Delay,
+    Item,
+    Process,
+    Station,
+    Step,
+    StepTransition,
+    Suspension,
+    Worker,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ChangelistQueriesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        cls.worker = Worker.objects.create(user=cls.user)
+        cls.process = Process.objects.create(name="Process")
+        stations = [Station.objects.create(name=f"Station {i}") for i in range(2)]
+        cls.transitions = []
+        for i in range(3):
+            step = Step.objects.create(name=f"Step {i}")
+            step.stations.set(stations)
+            cls.transitions.append(
+                StepTransition.objects.create(process=cls.process, creates=step)
+            )
+        cls.transitions[2].required_steps.set(cls.transitions[:2])
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def add_records(self, count):
+        for _ in range(count):
+            item = Item.objects.create(process=self.process)
+            for task in item.spawn_tasks():
+                Delay.objects.create(
+                    task=task, worker=self.worker, duration=timedelta(hours=1)
+                )
+                Suspension.objects.create(task=task, worker=self.worker)
+                Commit.objects.create(task=task, worker=self.worker)
+            transition = StepTransition.objects.create(
+                process=self.process, creates=Step.objects.first()
+            )
+            transition.required_steps.set(self.transitions)
+
+    def assertChangelistQueries(self, model, num):
+        url = reverse(f"admin:iris_{model._meta.model_name}_changelist")
+        for count in [1, 5]:
+            self.add_records(count)
+            invalidate_transition_labels()
+            with self.subTest(records=count), self.assertNumQueries(num):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_commit_changelist(self):
+        self.assertChangelistQueries(Commit, 8)
+
+    def test_delay_changelist(self):
+        self.assertChangelistQueries(Delay, 8)
+
+    def test_suspension_changelist(self):
+        self.assertChangelistQueries(Suspension, 8)
+
+    def test_step_transition_changelist(self):
+        self.assertChangelistQueries(StepTransition, 7)
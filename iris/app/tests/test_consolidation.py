@@ -0,0 +1,104 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from iris.app.graph import _graphs
+from iris.app.models import (
+    Commit,
+    Item,
+    Process,
+    Step,
+    StepTransition,
+    Task,
+    Worker,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ConsolidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.worker = Worker.objects.create(user=User.objects.create_user("worker"))
+        cls.process = Process.objects.create(name="Process")
+        cls.cut, cls.sew, cls.join, cls.pack = [
+            StepTransition.objects.create(
+                process=cls.process, creates=Step.objects.create(name=name)
+            )
+            for name in ["Cut", "Sew", "Join", "Pack"]
+        ]
+        cls.join.required_steps.set([cls.cut, cls.sew])
+        cls.pack.required_steps.set([cls.join])
+
+    def setUp(self):
+        _graphs.clear()
+
+    def create_item(self):
+        item = Item.objects.create(process=self.process)
+        item.spawn_tasks()
+        return item
+
+    def get_task(self, item, transition):
+        return Task.objects.get(item=item, step_transition=transition)
+
+    def commit(self, *tasks):
+        commits = Commit.objects.bulk_create(
+            [Commit(task=task, worker=self.worker) for task in tasks]
+        )
+        return list(
+            Commit.objects.filter(
+                pk__in=[commit.pk for commit in commits]
+            ).spawn_and_consolidate_tasks()
+        )
+
+    def assertTransitions(self, item, transitions):
+        self.assertCountEqual(
+            item.tasks.values_list("step_transition", flat=True),
+            [transition.pk for transition in transitions],
+        )
+
+    def test_roots_are_spawned(self):
+        item = self.create_item()
+        self.assertTransitions(item, [self.cut, self.sew])
+
+    def test_join_waits_for_every_requirement(self):
+        item = self.create_item()
+        self.assertEqual(self.commit(self.get_task(item, self.cut)), [])
+        self.assertTransitions(item, [self.cut, self.sew])
+        (task,) = self.commit(self.get_task(item, self.sew))
+        self.assertEqual(task.step_transition, self.join)
+        self.assertTransitions(item, [self.cut, self.sew, self.join])
+
+    def test_chain_after_join(self):
+        item = self.create_item()
+        self.commit(self.get_task(item, self.cut), self.get_task(item, self.sew))
+        (task,) = self.commit(self.get_task(item, self.join))
+        self.assertEqual(task.step_transition, self.pack)
+        self.assertEqual(task.dispatch_depth, 2)
+
+    def test_batch_with_commits_sharing_an_item(self):
+        item = self.create_item()
+        tasks = self.commit(
+            self.get_task(item, self.cut), self.get_task(item, self.sew)
+        )
+        self.assertEqual([task.step_transition for task in tasks], [self.join])
+        self.assertTransitions(item, [self.cut, self.sew, self.join])
+
+    def test_batch_across_items(self):
+        complete, partial = self.create_item(), self.create_item()
+        tasks = self.commit(
+            self.get_task(complete, self.cut),
+            self.get_task(complete, self.sew),
+            self.get_task(partial, self.cut),
+        )
+        self.assertEqual(
+            [(task.item_id, task.step_transition) for task in tasks],
+            [(complete.pk, self.join)],
+        )
+        self.assertTransitions(partial, [self.cut, self.sew])
+
+    def test_counters_follow_consolidation(self):
+        item = self.create_item()
+        self.commit(self.get_task(item, self.cut), self.get_task(item, self.sew))
+        item.refresh_from_db()
+        self.assertEqual((item.task_count, item.committed_count), (3, 2))
@@ -0,0 +1,108 @@
+from tempfile import NamedTemporaryFile
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from iris.app.models import Item, Process, Step, StepTransition
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ImportItemsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        cls.process = Process.objects.create(name="Process")
+        StepTransition.objects.create(
+            process=cls.process, creates=Step.objects.create(name="Step")
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post(self, content, content_type="text/csv"):
+        return self.client.post(
+            reverse("iris:item_import"), content, content_type=content_type
+        )
+
+    def assertFormatError(self, response, message):
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["error"].startswith(message))
+        self.assertFalse(Item.objects.exists())
+
+    def test_csv(self):
+        response = self.post(
+            b"\xef\xbb\xbfprocess,description,quantity\r\n"
+            b'Process,"First, item",2\r\n'
+            b"Process,Second item,\r\n"
+        )
+        self.assertEqual(response.status_code, 201)
+        items = Item.objects.order_by("pk")
+        self.assertEqual(
+            response.json(), {"created": [i.pk for i in items], "errors": []}
+        )
+        self.assertEqual(
+            list(items.values_list("description", "quantity", "task_count")),
+            [("First, item", 2, 1), ("Second item", 1, 1)],
+        )
+
+    def test_csv_with_carriage_returns(self):
+        response = self.post(b"process,description\rProcess,Item\r")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Item.objects.get().description, "Item")
+
+    def test_json(self):
+        response = self.post(
+            b'[{"process": "%d", "has_priority": true}]' % self.process.pk,
+            "application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Item.objects.get().has_priority)
+
+    def test_row_errors(self):
+        response = self.post(b"process,quantity\nProcess,1\nUnknown,1\nProcess,0\n")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()["created"]), 1)
+        self.assertEqual(
+            [
+                (error["row"], list(error["errors"]))
+                for error in response.json()["errors"]
+            ],
+            [(2, ["process"]), (3, ["quantity"])],
+        )
+
+    def test_undecodable(self):
+        self.assertFormatError(
+            self.post(b"process\n\xff\xfeProcess\n"), "Invalid UTF-8 text"
+        )
+
+    def test_malformed_csv(self):
+        self.assertFormatError(
+            self.post(b'process,description\nProcess,"%s"\n' % (b"x" * 200000)),
+            "Invalid CSV",
+        )
+
+    def test_malformed_json(self):
+        self.assertFormatError(
+            self.post(b'[{"process": ', "application/json"), "Invalid JSON"
+        )
+        self.assertFormatError(
+            self.post(b'{"process": "Process"}', "application/json"),
+            "The JSON import must be a list of objects.",
+        )
+
+    def test_unsupported_format(self):
+        self.assertFormatError(
+            self.post(b"process", "text/plain"), "Unsupported import format."
+        )
+
+    def test_command_reports_undecodable_file(self):
+        with NamedTemporaryFile(suffix=".csv") as f:
+            f.write(b"process\n\xff\xfeProcess\n")
+            f.flush()
+            with self.assertRaisesMessage(CommandError, "Invalid UTF-8 text"):
+                call_command("import_items", f.name)
+        self.assertFalse(Item.objects.exists())
@@ -0,0 +1,57 @@
+import re
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from iris.app.models import Station, Task
+from iris.app.pagination import keyset_filter
+
+PAGE_SIZE = 51
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN output is PostgreSQL's.")
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TaskPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "generate_workshop", items=3000, seed=1, prefix="Plan", stdout=StringIO()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        cls.station = Station.objects.first()
+
+    def assertNoTaskSeqScan(self, plan):
+        self.assertIsNone(re.search(r"Seq Scan on iris_task\b", plan), plan)
+
+    def test_station_pending_page(self):
+        plan = (
+            Task.objects.in_station(self.station)
+            .pending()
+            .in_dispatch_order()[:PAGE_SIZE]
+            .explain()
+        )
+        self.assertNoTaskSeqScan(plan)
+        self.assertIn("iris_task_dispatch_idx", plan)
+
+    def test_completed_first_page(self):
+        plan = Task.objects.completed().order_by("created", "pk")[:PAGE_SIZE].explain()
+        self.assertNoTaskSeqScan(plan)
+        self.assertIn("iris_task_completed_idx", plan)
+
+    def test_completed_next_page(self):
+        ordering = ["created", "pk"]
+        last = Task.objects.completed().order_by(*ordering)[PAGE_SIZE]
+        plan = (
+            Task.objects.completed()
+            .filter(keyset_filter(ordering, [last.created, last.pk]))
+            .order_by(*ordering)[:PAGE_SIZE]
+            .explain()
+        )
+        self.assertNoTaskSeqScan(plan)
+        self.assertIn("iris_task_completed_idx", plan)
@@ -0,0 +1,133 @@
+from base64 import urlsafe_b64encode
+from datetime import date
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+
+from iris.app.managers import DISPATCH_ORDERING
+from iris.app.models import (
+    Commit,
+    Item,
+    Process,
+    Station,
+    Step,
+    StepTransition,
+    Task,
+    Worker,
+)
+from iris.app.pagination import KeysetPaginationMixin, encode_cursor
+
+PAGE_SIZE = 3
+MAX_PAGES = 10
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+@patch.object(KeysetPaginationMixin, "paginate_by", PAGE_SIZE)
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        cls.worker = Worker.objects.create(user=cls.user)
+        cls.station = Station.objects.create(name="Station")
+        process = Process.objects.create(name="Process")
+        step = Step.objects.create(name="Step")
+        step.stations.add(cls.station)
+        StepTransition.objects.create(process=process, creates=step)
+        created = now()
+        items = Item.objects.bulk_create(
+            [Item(process=process) for _ in range(6)]
+            + [
+                Item(process=process, has_priority=True),
+                Item(process=process, due_date=date(2030, 1, 1)),
+            ]
+        )
+        Item.objects.filter(pk__in=[item.pk for item in items]).update(created=created)
+        Item.objects.filter(pk__in=[item.pk for item in items]).spawn_tasks()
+        cls.priority_item, cls.due_item = items[-2:]
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_page(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        page = response.context["page_obj"]
+        self.assertLessEqual(len(page), PAGE_SIZE)
+        return page
+
+    def walk_forward(self, url):
+        pks, params = [], {}
+        for _ in range(MAX_PAGES):
+            page = self.get_page(url, params)
+            pks += [task.pk for task in page]
+            if not page.has_next():
+                return pks
+            params = {"after": page.next_cursor}
+        self.fail("The forward walk did not end.")
+
+    def walk_backward(self, url, cursor):
+        pks, params = [], {"before": cursor}
+        for _ in range(MAX_PAGES):
+            page = self.get_page(url, params)
+            pks = [task.pk for task in page] + pks
+            if not page.has_previous():
+                return pks
+            params = {"before": page.previous_cursor}
+        self.fail("The backward walk did not end.")
+
+    def assertWalks(self, url, tasks, ordering):
+        pks = [task.pk for task in tasks]
+        self.assertEqual(self.walk_forward(url), pks)
+        self.assertEqual(
+            self.walk_backward(url, encode_cursor(tasks[-1], ordering)), pks[:-1]
+        )
+
+    def test_dispatch_order(self):
+        tasks = list(Task.objects.pending().in_dispatch_order())
+        self.assertEqual(len(tasks), 8)
+        self.assertEqual(tasks[0].item, self.priority_item)
+        self.assertEqual(tasks[1].item, self.due_item)
+
+    def test_walk_pending_tasks(self):
+        self.assertWalks(
+            reverse("iris:task_list", args=["pending"]),
+            list(Task.objects.pending().in_dispatch_order()),
+            DISPATCH_ORDERING,
+        )
+
+    def test_walk_cached_station_tasks(self):
+        self.assertWalks(
+            reverse("iris:station", args=[self.station.pk, "pending"]),
+            list(Task.objects.in_station(self.station).pending().in_dispatch_order()),
+            DISPATCH_ORDERING,
+        )
+
+    def test_walk_completed_tasks_with_tied_creation(self):
+        tasks = Task.objects.all()
+        Commit.objects.bulk_create(
+            [Commit(task=task, worker=self.worker) for task in tasks]
+        )
+        tasks.update(created=now())
+        ordering = KeysetPaginationMixin.keyset_ordering
+        self.assertWalks(
+            reverse("iris:task_list", args=["completed"]),
+            list(Task.objects.completed().order_by(*ordering)),
+            ordering,
+        )
+
+    def test_invalid_cursor(self):
+        url = reverse("iris:task_list", args=["pending"])
+        for params in [
+            {"after": "not a cursor"},
+            {"before": urlsafe_b64encode(b"[1]").decode()},
+            {"after": urlsafe_b64encode(b'[true, "not a date", 0, 0, 1]').decode()},
+        ]:
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(url, params).status_code, 404)
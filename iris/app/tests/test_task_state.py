@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from iris.app.models import (
+    Commit,
+    Delay,
+    Item,
+    Process,
+    Step,
+    StepTransition,
+    Suspension,
+    Task,
+    TaskState,
+    Worker,
+)
+from iris.app.scheduling import expire_delays
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TaskStateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.worker = Worker.objects.create(user=User.objects.create_user("worker"))
+        process = Process.objects.create(name="Process")
+        StepTransition.objects.create(
+            process=process, creates=Step.objects.create(name="Step")
+        )
+        cls.item = Item.objects.create(process=process)
+        (cls.task,) = cls.item.spawn_tasks()
+
+    def assertState(self, state, blocked_until=None, active_suspension=None):
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.state, state)
+        self.assertEqual(self.task.blocked_until, blocked_until)
+        self.assertEqual(self.task.active_suspension, active_suspension)
+
+    def assertPending(self, pending):
+        self.assertEqual(
+            Task.objects.pending().filter(pk=self.task.pk).exists(), pending
+        )
+
+    def test_new_task_is_pending(self):
+        self.assertState(TaskState.PENDING)
+        self.assertPending(True)
+
+    def test_commit_and_uncommit(self):
+        commit = Commit.objects.create(task=self.task, worker=self.worker)
+        self.assertState(TaskState.COMPLETED)
+        self.assertPending(False)
+        self.assertTrue(Task.objects.completed().filter(pk=self.task.pk).exists())
+        commit.delete()
+        self.assertState(TaskState.PENDING)
+        self.assertPending(True)
+
+    def test_bulk_commit(self):
+        Commit.objects.bulk_create([Commit(task=self.task, worker=self.worker)])
+        self.assertState(TaskState.COMPLETED)
+
+    def test_delay_and_expiry(self):
+        delay = Delay.objects.create(
+            task=self.task, worker=self.worker, duration=timedelta(hours=1)
+        )
+        self.assertState(TaskState.DELAYED, blocked_until=delay.ends)
+        self.assertPending(False)
+        self.assertTrue(Task.objects.delayed().filter(pk=self.task.pk).exists())
+        self.assertEqual(expire_delays(until=delay.ends), {self.task.pk})
+        self.assertState(TaskState.PENDING)
+        self.assertPending(True)
+
+    def test_longest_delay_blocks(self):
+        Delay.objects.create(task=self.task, worker=self.worker, duration=timedelta(1))
+        delay = Delay.objects.create(
+            task=self.task, worker=self.worker, duration=timedelta(2)
+        )
+        self.assertState(TaskState.DELAYED, blocked_until=delay.ends)
+
+    def test_end_delay(self):
+        delay = Delay.objects.create(
+            task=self.task, worker=self.worker, duration=timedelta(hours=1)
+        )
+        delay.end()
+        self.assertState(TaskState.PENDING)
+
+    def test_suspend_and_lift(self):
+        suspension = Suspension.objects.create(task=self.task, worker=self.worker)
+        self.assertState(TaskState.SUSPENDED, active_suspension=suspension)
+        self.assertPending(False)
+        self.assertTrue(Task.objects.suspended().filter(pk=self.task.pk).exists())
+        suspension.lift()
+        self.assertState(TaskState.PENDING)
+        self.assertPending(True)
+
+    def test_lift_suspension_of_delayed_task(self):
+        delay = Delay.objects.create(
+            task=self.task, worker=self.worker, duration=timedelta(hours=1)
+        )
+        suspension = Suspension.objects.create(task=self.task, worker=self.worker)
+        self.assertState(
+            TaskState.SUSPENDED, blocked_until=delay.ends, active_suspension=suspension
+        )
+        suspension.lift()
+        self.assertState(TaskState.DELAYED, blocked_until=delay.ends)
+
+    def test_commit_suspended_task(self):
+        suspension = Suspension.objects.create(task=self.task, worker=self.worker)
+        Commit.objects.create(task=self.task, worker=self.worker)
+        self.assertState(TaskState.COMPLETED, active_suspension=suspension)
+
+    def test_cancel_and_restore(self):
+        self.item.cancel("Canceled")
+        self.assertState(TaskState.PENDING)
+        self.assertPending(False)
+        self.item.restore()
+        self.assertPending(True)
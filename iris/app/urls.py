@@ -9,17 +9,25 @@ from iris.app.views import (
     CreateSuspensionForTaskView,
     DelayEndView,
     DelayFormView,
+    ExportView,
     GeneralTaskListView,
+    ImportItemsView,
     IndexView,
     IrisLoginView,
     IrisLogoutView,
     ItemFormView,
     ItemListView,
+    ProfilingStatsView,
     RestoreItemView,
+    StationEventsView,
+    StationTaskCardsView,
     StationTaskListView,
+    StationTasksCacheStatsView,
+    SummaryDashboardView,
     SuspensionFormView,
     SuspensionLiftView,
     TaskDetailView,
+    TaskEventListView,
     TasksWithIssuesView,
 )
 
@@ -35,6 +43,23 @@ urlpatterns = [
         StationTaskListView.as_view(),
         name="station",
     ),
+    path(
+        "station/<int:station>/<str:status>/cards",
+        StationTaskCardsView.as_view(),
+        name="station_cards",
+    ),
+    path(
+        "station/<int:station>/<str:status>/events",
+        StationEventsView.as_view(),
+        name="station_events",
+    ),
+    path(
+        "station/cache/stats",
+        StationTasksCacheStatsView.as_view(),
+        name="station_cache_stats",
+    ),
+    path("profiling/stats", ProfilingStatsView.as_view(), name="profiling_stats"),
+    path("analytics/", SummaryDashboardView.as_view(), name="analytics"),
     path("issues/", TasksWithIssuesView.as_view(), name="issues"),
     path("issues/<str:status>", TasksWithIssuesView.as_view(), name="issues"),
     path("tasks/", GeneralTaskListView.as_view(), name="task_list"),
@@ -78,4 +103,7 @@ urlpatterns = [
     path("item/<int:pk>/cancel/", CancelItemView.as_view(), name="item_cancel"),
     path("item/<int:pk>/restore/", RestoreItemView.as_view(), name="item_restore"),
     path("item/add/", CreateItemView.as_view(), name="item_add"),
+    path("item/import/", ImportItemsView.as_view(), name="item_import"),
+    path("export/<str:kind>.<str:format>", ExportView.as_view(), name="export"),
+    path("events/", TaskEventListView.as_view(), name="events"),
 ]
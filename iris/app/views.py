@@ -1,8 +1,24 @@
+from datetime import timedelta
+
 from django.contrib import messages
-from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.contrib.auth.mixins import (
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    UserPassesTestMixin,
+)
 from django.contrib.auth.views import LoginView, LogoutView, RedirectURLMixin
-from django.http import HttpResponseRedirect
-from django.urls import reverse_lazy
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.urls import reverse, reverse_lazy
+from django.utils.timezone import localdate
 from django.utils.translation import gettext as _
 from django.views.generic import (
     CreateView,
@@ -14,9 +30,36 @@ from django.views.generic import (
 )
 from django.views.generic.edit import ContextMixin, SingleObjectMixin
 
-from iris.app.forms import CancelItemForm, CreateItemModelForm, DelayModelForm
+from iris.app.analytics import get_last_run, get_summary_rows
+from iris.app.caching import (
+    STATION_TASKS_CACHED_STATUSES,
+    get_station_task_keys,
+    station_tasks_stats,
+)
+from iris.app.events import read_events, serialize_event
+from iris.app.exporting import (
+    EXPORT_FORMATS,
+    EXPORTS,
+    export_rows,
+    get_export_queryset,
+    stream_async,
+    stream_csv,
+    stream_json,
+)
+from iris.app.forms import (
+    CancelItemForm,
+    CreateItemModelForm,
+    DelayModelForm,
+    ExportFilterForm,
+    SummaryFilterForm,
+    TaskEventFilterForm,
+)
+from iris.app.importing import ImportFormatError, import_items, read_rows
+from iris.app.live import LIVE_STATUSES, station_feeds
+from iris.app.managers import DISPATCH_ORDERING
 from iris.app.models import (
     Commit,
+    DailySummary,
     Delay,
     Item,
     NotCanceledError,
@@ -26,6 +69,8 @@ from iris.app.models import (
     Task,
     Worker,
 )
+from iris.app.pagination import KeysetPaginationMixin
+from iris.app.profiling import profiling_stats
 
 
 class ContextRedirectURLMixin(RedirectURLMixin, ContextMixin):
@@ -51,7 +96,7 @@ class IrisLogoutView(LogoutView):
     next_page = reverse_lazy("iris:index")
 
 
-class BaseTaskListMixin(ListView):
+class BaseTaskListMixin(KeysetPaginationMixin, ListView):
     model = Task
 
     def get(self, request, status="pending"):
@@ -59,7 +104,7 @@ class BaseTaskListMixin(ListView):
         return super().get(request, status=status)
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().with_state()
         if self.status == "delayed":
             return queryset.delayed()
         elif self.status == "suspended":
@@ -71,6 +116,11 @@ class BaseTaskListMixin(ListView):
         else:
             return queryset.pending()
 
+    def get_keyset_ordering(self):
+        if self.status == "completed":
+            return super().get_keyset_ordering()
+        return DISPATCH_ORDERING
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["status"] = self.status
@@ -85,8 +135,13 @@ class StationTaskListView(BaseTaskListMixin, ListView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        return queryset.in_station(self.station)
+        return super().get_queryset().in_station(self.station)
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.status not in STATION_TASKS_CACHED_STATUSES:
+            return super().paginate_queryset(queryset, page_size)
+        keys = get_station_task_keys(self.station.pk, self.status)
+        return self.paginate_keys(queryset, keys, page_size)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -94,6 +149,55 @@ class StationTaskListView(BaseTaskListMixin, ListView):
         return context
 
 
+class StationTaskCardsView(StationTaskListView):
+    template_name = "iris/screens/station_cards.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["return_path"] = reverse(
+            "iris:station", kwargs={"station": self.station.pk, "status": self.status}
+        )
+        return context
+
+
+class StationEventsView(View):
+    async def get(self, request, station, status):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponseForbidden()
+        if status not in LIVE_STATUSES:
+            raise Http404(_("Unknown task status."))
+        if not await Station.objects.filter(pk=station).aexists():
+            raise Http404(_("The station does not exists."))
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(_("Live updates require an ASGI server."), status=501)
+        return StreamingHttpResponse(
+            station_feeds.stream(station, status),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
+class StationTasksCacheStatsView(UserPassesTestMixin, View):
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(station_tasks_stats)
+
+
+class ProfilingStatsView(UserPassesTestMixin, View):
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse({"views": profiling_stats.summary()})
+
+    def delete(self, request, *args, **kwargs):
+        profiling_stats.reset()
+        return HttpResponse(status=204)
+
+
 class GeneralTaskListView(BaseTaskListMixin, ListView):
     template_name = "iris/screens/tasks.html"
 
@@ -105,7 +209,7 @@ class TasksWithIssuesView(BaseTaskListMixin, ListView):
         return super().get(request, status=status)
 
 
-class ItemListView(LoginRequiredMixin, ListView):
+class ItemListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     template_name = "iris/screens/items.html"
     model = Item
 
@@ -115,11 +219,14 @@ class ItemListView(LoginRequiredMixin, ListView):
 
     def get_queryset(self):
         if self.status == "completed":
-            return Item.objects.completed()
+            queryset = Item.objects.completed()
         elif self.status == "canceled":
-            return Item.objects.canceled()
+            queryset = Item.objects.canceled()
         else:
-            return Item.objects.pending()
+            queryset = Item.objects.pending()
+        return queryset.prefetch_related(
+            Prefetch("tasks", queryset=Task.objects.with_state())
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -127,6 +234,36 @@ class ItemListView(LoginRequiredMixin, ListView):
         return context
 
 
+class SummaryDashboardView(PermissionRequiredMixin, TemplateView):
+    template_name = "iris/screens/analytics.html"
+    permission_required = "iris.view_task"
+    default_days = 30
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        form = SummaryFilterForm(self.request.GET)
+        filters = form.cleaned_data if form.is_valid() else {}
+        until = filters.get("until") or localdate()
+        since = filters.get("since") or until - timedelta(days=self.default_days)
+        station = filters.get("station")
+        summaries = DailySummary.objects.filter(day__gte=since, day__lte=until)
+        context.update(
+            {
+                "form": form,
+                "since": since,
+                "until": until,
+                "station": station,
+                "station_rows": get_summary_rows(summaries, "station__name", "station"),
+                "last_run": get_last_run(),
+            }
+        )
+        if station is not None:
+            summaries = summaries.filter(station=station)
+            context["step_rows"] = get_summary_rows(summaries, "step__name", "step")
+        context["day_rows"] = get_summary_rows(summaries, "day")
+        return context
+
+
 class TaskDetailView(DetailView):
     template_name = "iris/detail/task.html"
     model = Task
@@ -238,7 +375,7 @@ class ItemFormView(PermissionRequiredMixin, ContextRedirectURLMixin, UpdateView)
     template_name = "iris/forms/edit_item.html"
     model = Item
     permission_required = "iris.change_item"
-    fields = ["description", "notes"]
+    fields = ["description", "notes", "due_date"]
 
 
 class CreateItemView(PermissionRequiredMixin, ContextRedirectURLMixin, CreateView):
@@ -253,6 +390,80 @@ class CreateItemView(PermissionRequiredMixin, ContextRedirectURLMixin, CreateVie
         return context
 
 
+class ImportItemsView(PermissionRequiredMixin, View):
+    permission_required = "iris.add_item"
+    raise_exception = True
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get("file")
+        if upload is not None:
+            format = upload.name.rsplit(".", 1)[-1].lower()
+            content = upload.read()
+        else:
+            format = request.content_type.rsplit("/", 1)[-1]
+            content = request.body
+        format = request.GET.get("format", format)
+        try:
+            rows = read_rows(content, format)
+        except ImportFormatError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        items, errors = import_items(rows)
+        return JsonResponse(
+            {"created": [item.pk for item in items], "errors": errors},
+            status=201 if items else 200,
+        )
+
+
+class ExportView(PermissionRequiredMixin, View):
+    raise_exception = True
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        if (
+            self.kwargs["kind"] not in EXPORTS
+            or self.kwargs["format"] not in EXPORT_FORMATS
+        ):
+            raise Http404(_("Unknown export."))
+
+    def get_permission_required(self):
+        model = EXPORTS[self.kwargs["kind"]][0]
+        return [f"iris.view_{model._meta.model_name}"]
+
+    def get(self, request, kind, format):
+        form = ExportFilterForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors.get_json_data()}, status=400)
+        rows = export_rows(kind, get_export_queryset(kind, **form.cleaned_data))
+        if format == "csv":
+            content, content_type = stream_csv(kind, rows), "text/csv"
+        else:
+            content, content_type = stream_json(rows), "application/json"
+        if isinstance(request, ASGIRequest):
+            content = stream_async(content)
+        return StreamingHttpResponse(
+            content,
+            content_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{kind}.{format}"'},
+        )
+
+
+class TaskEventListView(PermissionRequiredMixin, View):
+    permission_required = "iris.view_taskevent"
+    raise_exception = True
+
+    def get(self, request, *args, **kwargs):
+        form = TaskEventFilterForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors.get_json_data()}, status=400)
+        events = read_events(**form.cleaned_data)
+        return JsonResponse(
+            {
+                "events": [serialize_event(event) for event in events],
+                "next": events[-1].sequence if events else form.cleaned_data["after"],
+            }
+        )
+
+
 class CancelItemView(PermissionRequiredMixin, ContextRedirectURLMixin, UpdateView):
     template_name = "iris/forms/cancel_item.html"
     model = Item
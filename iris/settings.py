@@ -38,6 +38,30 @@ DATABASES = {
         else loads(DJANGO_DEFAULT_DB)
     )
 }
+DJANGO_DB_POOL = loads(getenv("DJANGO_DB_POOL", "false"))
+DATABASES["default"].setdefault(
+    "CONN_MAX_AGE",
+    0 if DJANGO_DB_POOL else loads(getenv("DJANGO_DB_CONN_MAX_AGE", "0")),
+)
+DATABASES["default"].setdefault(
+    "CONN_HEALTH_CHECKS", loads(getenv("DJANGO_DB_CONN_HEALTH_CHECKS", "false"))
+)
+if DJANGO_DB_POOL and DATABASES["default"]["ENGINE"].endswith("postgresql"):
+    DATABASES["default"].setdefault("OPTIONS", {}).setdefault("pool", DJANGO_DB_POOL)
+
+# Cache
+DJANGO_REDIS_URL = getenv("DJANGO_REDIS_URL", "redis://redis:6379/0")
+DJANGO_DEFAULT_CACHE = getenv("DJANGO_DEFAULT_CACHE", None)
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": DJANGO_REDIS_URL,
+        }
+        if DJANGO_DEFAULT_CACHE is None
+        else loads(DJANGO_DEFAULT_CACHE)
+    )
+}
 
 # General framework
 INSTALLED_APPS = [
@@ -51,7 +75,9 @@ INSTALLED_APPS = [
     "iris_wc",
 ]
 MIDDLEWARE = [
+    "iris.app.profiling.QueryProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -94,6 +120,23 @@ MEDIA_ROOT = STATE_DIR / "media"
 MEDIA_URL = "media/"
 STATIC_ROOT = STATE_DIR / "cdn"
 STATIC_URL = "static/"
+WHITENOISE_USE_FINDERS = DEBUG
+WHITENOISE_AUTOREFRESH = DEBUG
 
 ALLOWED_HOSTS_STR = getenv("DJANGO_ALLOWED_HOSTS", "[]")
 ALLOWED_HOSTS = loads(ALLOWED_HOSTS_STR)
+
+# Profiling
+IRIS_PROFILING = loads(getenv("DJANGO_IRIS_PROFILING", "false"))
+IRIS_PROFILING_SAMPLES = int(getenv("DJANGO_IRIS_PROFILING_SAMPLES", 1000))
+IRIS_PROFILING_SLOWEST = int(getenv("DJANGO_IRIS_PROFILING_SLOWEST", 5))
+
+# Delay expiry
+IRIS_DELAY_SCHEDULER = loads(getenv("DJANGO_IRIS_DELAY_SCHEDULER", "true"))
+IRIS_DELAY_SCHEDULER_INTERVAL = int(getenv("DJANGO_IRIS_DELAY_SCHEDULER_INTERVAL", 60))
+
+# Live station screens
+IRIS_LIVE_REDIS_URL = getenv("DJANGO_IRIS_LIVE_REDIS_URL", DJANGO_REDIS_URL)
+
+# WooCommerce
+IRIS_WC_WEBHOOK_SECRET = getenv("DJANGO_IRIS_WC_WEBHOOK_SECRET")
@@ -10,6 +10,7 @@ admin.site.site_title = _("Admin")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("woocommerce/", include("iris_wc.urls")),
     path("", include("iris.app.urls")),
 ]
 
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+import re
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from json import dumps
+from threading import Event
+from time import perf_counter, sleep
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urljoin
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+STATUSES = ["pending", "delayed", "suspended", "completed"]
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+def login(base_url, username, password):
+    jar = CookieJar()
+    opener = build_opener(HTTPCookieProcessor(jar))
+    login_url = urljoin(base_url, "login/")
+    opener.open(login_url).read()
+    csrftoken = next(cookie.value for cookie in jar if cookie.name == "csrftoken")
+    response = opener.open(
+        Request(
+            login_url,
+            data=urlencode(
+                {
+                    "username": username,
+                    "password": password,
+                    "csrfmiddlewaretoken": csrftoken,
+                }
+            ).encode(),
+            headers={"Referer": login_url},
+        )
+    )
+    if "sessionid" not in {cookie.name for cookie in jar}:
+        raise SystemExit(f"Could not log in as {username}.")
+    return opener, response.read().decode()
+
+
+def discover_urls(base_url, index_html, statuses):
+    stations = sorted(set(re.findall(r'href="(/station/\d+)"', index_html)))
+    if not stations:
+        raise SystemExit("No station links found in the navigation bar.")
+    return [
+        urljoin(base_url, station if status == "pending" else f"{station}/{status}")
+        for station in stations
+        for status in statuses
+    ]
+
+
+def worker(opener, urls, offset, stop, results):
+    index = offset
+    while not stop.is_set():
+        url = urls[index % len(urls)]
+        index += 1
+        start = perf_counter()
+        try:
+            with opener.open(url) as response:
+                response.read()
+                status = response.status
+        except HTTPError as e:
+            status = e.code
+        except URLError:
+            status = None
+        results.append((url, status, (perf_counter() - start) * 1000))
+
+
+def summarize(results, duration):
+    by_url = {}
+    for url, status, elapsed in results:
+        by_url.setdefault(url, []).append((status, elapsed))
+    report = {}
+    for url, samples in sorted(by_url.items()):
+        timings = [elapsed for _status, elapsed in samples]
+        report[url] = {
+            "requests": len(samples),
+            "errors": sum(1 for status, _elapsed in samples if status != 200),
+            "rps": round(len(samples) / duration, 2),
+            **{
+                f"p{percent}_ms": round(percentile(timings, percent), 3)
+                for percent in [50, 90, 99]
+            },
+            "max_ms": round(max(timings), 3),
+        }
+    return report
+
+
+def main():
+    parser = ArgumentParser(description="Load test the station screens of Iris.")
+    parser.add_argument("--base-url", default="http://localhost:8000/")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds.")
+    parser.add_argument(
+        "--status",
+        action="append",
+        choices=STATUSES,
+        help="Station screens to hit. Defaults to pending only.",
+    )
+    args = parser.parse_args()
+
+    opener, index_html = login(args.base_url, args.username, args.password)
+    urls = discover_urls(args.base_url, index_html, args.status or ["pending"])
+    openers = [opener] + [
+        login(args.base_url, args.username, args.password)[0]
+        for _ in range(args.concurrency - 1)
+    ]
+    stop = Event()
+    results = []
+    start = perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        for offset, client in enumerate(openers):
+            executor.submit(worker, client, urls, offset, stop, results)
+        sleep(args.duration)
+        stop.set()
+    duration = perf_counter() - start
+    print(
+        dumps(
+            {
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "duration": round(duration, 3),
+                "requests": len(results),
+                "rps": round(len(results) / duration, 2),
+                "urls": summarize(results, duration),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()